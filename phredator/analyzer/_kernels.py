@@ -0,0 +1,67 @@
+"""
+Numeric kernels for adaptive threshold calibration.
+
+The kernels are written in the NumPy subset that Numba supports. When
+Numba is installed they are compiled with njit(cache=True), so the
+compiled code persists on disk and later CLI runs skip recompilation.
+Without Numba they run as plain NumPy functions.
+
+Numba is imported on the first kernel call rather than with this module,
+so importing the analyzer package does not pay for it.
+"""
+
+import functools
+from typing import Tuple
+
+import numpy as np
+
+
+def _jit(func):
+    compiled = None
+    
+    @functools.wraps(func)
+    def dispatch(*args):
+        nonlocal compiled
+        if compiled is None:
+            try:
+                from numba import njit
+            except ImportError:  # Optional speed-up; kernels run as plain NumPy
+                compiled = func
+            else:
+                compiled = njit(cache=True)(func)
+        return compiled(*args)
+    
+    return dispatch
+
+
+@_jit
+def median_mad(arr: np.ndarray, deviations: np.ndarray) -> Tuple[float, float]:
+    """
+    Return (median, MAD) of a non-empty float64 array.
+    
+    deviations is a caller-owned scratch buffer of the same size; on return
+    it holds |x - median| in position order, ready for outlier_mask.
+    """
+    med = np.median(arr)
+    np.subtract(arr, med, deviations)
+    np.abs(deviations, deviations)
+    mad = np.median(deviations)
+    return med, mad
+
+
+@_jit
+def outlier_mask(deviations: np.ndarray, mad: float, k: float) -> np.ndarray:
+    """Boolean mask of positions where |x - median| > k * MAD"""
+    return deviations > k * mad
+
+
+@_jit
+def regression_slope(arr: np.ndarray) -> float:
+    """Least-squares slope of arr against positions 0..n-1 (0.0 if undefined)"""
+    n = arr.size
+    x = np.arange(n).astype(np.float64)
+    sum_x = x.sum()
+    denominator = n * (x * x).sum() - sum_x * sum_x
+    if denominator == 0:
+        return 0.0
+    return (n * (x * arr).sum() - sum_x * arr.sum()) / denominator
@@ -5,13 +5,45 @@ Uses statistical analysis to calibrate QC thresholds based on actual data
 distribution rather than fixed universal cutoffs.
 """
 
-import statistics
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import math
 
+import numpy as np
 
-@dataclass
+from phredator.analyzer._kernels import median_mad, outlier_mask, regression_slope
+from phredator.utils.helpers import DATACLASS_SLOTS
+
+
+# Trend names indexed by the codes computed in calibrate_batch
+_TREND_LABELS = np.array(["stable", "degrading", "improving"])
+# Confidence names indexed by the codes computed in _estimate_confidence_batch
+_CONFIDENCE_LABELS = np.array(["low", "medium", "high"])
+
+
+def extract_quality_means(per_base_quality: Dict) -> np.ndarray:
+    """Extract per-position mean qualities from parsed FastQC data as a float64 array"""
+    values = per_base_quality.values()
+    first = next(iter(values), None)
+    
+    if isinstance(first, dict):
+        # FastQC-style data is all dicts: skip the per-position type check
+        try:
+            return np.fromiter(
+                (pos_data["mean"] for pos_data in values if "mean" in pos_data),
+                dtype=np.float64
+            )
+        except TypeError:
+            pass  # Mixed value types; fall back to the checked path
+    
+    return np.fromiter(
+        (pos_data["mean"] for pos_data in values
+         if isinstance(pos_data, dict) and "mean" in pos_data),
+        dtype=np.float64
+    )
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ThresholdCalibration:
     """Results from adaptive threshold calibration"""
     mean_quality: float
@@ -45,6 +77,20 @@ class AdaptiveThresholdCalibrator:
             "acceptable": 25,
             "marginal": 20
         }
+        # Decision table: mean quality cutoffs and the baseline threshold each selects
+        self._thresh_cutoffs = np.array([25, 30, 35], dtype=np.float64)
+        self._thresh_values = np.array(
+            [self.baseline_thresholds[k] for k in ("acceptable", "good", "excellent")],
+            dtype=np.float64
+        )
+        # Reusable buffer for absolute deviations across calls
+        self._scratch = np.empty(0, dtype=np.float64)
+    
+    def _deviation_buffer(self, size: int) -> np.ndarray:
+        """Return a scratch view of the given size, growing the buffer if needed"""
+        if self._scratch.size < size:
+            self._scratch = np.empty(size, dtype=np.float64)
+        return self._scratch[:size]
     
     def calculate_mad(self, values: List[float]) -> float:
         """
@@ -53,36 +99,69 @@ class AdaptiveThresholdCalibrator:
         MAD is more robust than standard deviation for outlier detection.
         Formula: MAD = median(|x_i - median(x)|)
         """
-        if not values:
+        if len(values) == 0:
             return 0.0
         
-        median = statistics.median(values)
-        deviations = [abs(x - median) for x in values]
-        mad = statistics.median(deviations)
+        _, mad = self._median_and_mad(np.asarray(values, dtype=np.float64))
         return mad
     
-    def detect_outliers_mad(self, values: List[float], threshold: float = 3.0) -> List[int]:
+    def _median_and_mad(self, arr: np.ndarray) -> Tuple[float, float]:
+        """Return (median, MAD) of a float array, computing the median only once"""
+        median = np.median(arr)
+        deviations = self._deviation_buffer(arr.size)
+        np.subtract(arr, median, out=deviations)
+        np.abs(deviations, out=deviations)
+        # The deviations are a scratch buffer, so let NumPy partition them in place
+        mad = np.median(deviations, overwrite_input=True)
+        return float(median), float(mad)
+    
+    def detect_outliers_mad(self, values: List[float], threshold: float = 3.0,
+                            median: Optional[float] = None, mad: Optional[float] = None) -> List[int]:
         """
         Detect outlier positions using MAD method.
         
         A point is an outlier if |x_i - median| > threshold * MAD
         Using threshold=3 is standard in statistics (similar to 3-sigma rule)
+        
+        Callers that already know the median and MAD can pass them in to
+        avoid recomputing both.
         """
         if len(values) < 3:
             return []
         
-        median = statistics.median(values)
-        mad = self.calculate_mad(values)
+        arr = np.asarray(values, dtype=np.float64)
+        if median is None or mad is None:
+            _, _, outliers = self._stats(arr, threshold)
+            return outliers
         
-        if mad == 0:  # All values identical
+        if mad == 0:  # Most values identical
             return []
         
-        outliers = []
-        for i, val in enumerate(values):
-            if abs(val - median) > threshold * mad:
-                outliers.append(i)
+        deviations = self._deviation_buffer(arr.size)
+        np.subtract(arr, median, out=deviations)
+        np.abs(deviations, out=deviations)
+        return np.nonzero(outlier_mask(deviations, mad, threshold))[0].tolist()
+    
+    def _stats(self, arr: np.ndarray, threshold: float = 3.0) -> Tuple[float, float, List[int]]:
+        """
+        Return (median, MAD, outlier positions) of a non-empty float64 array.
+        
+        Arrays shorter than 3 never have outliers, so their median and MAD are
+        taken directly without allocating a deviations buffer.
+        """
+        if arr.size < 3:
+            if arr.size == 1:
+                return float(arr[0]), 0.0, []
+            return float(arr.mean()), float(abs(arr[1] - arr[0]) / 2), []
         
-        return outliers
+        deviations = self._deviation_buffer(arr.size)
+        median, mad = median_mad(np.ascontiguousarray(arr), deviations)
+        median, mad = float(median), float(mad)
+        
+        if mad == 0:  # Most values identical
+            return median, mad, []
+        
+        return median, mad, np.nonzero(outlier_mask(deviations, mad, threshold))[0].tolist()
     
     def calculate_trend(self, values: List[float]) -> Tuple[str, float]:
         """
@@ -95,36 +174,27 @@ class AdaptiveThresholdCalibrator:
         if len(values) < 5:
             return "stable", 0.0
         
-        n = len(values)
-        x = list(range(n))
-        y = values
-        
-        # Simple linear regression: y = mx + b
-        x_mean = sum(x) / n
-        y_mean = sum(y) / n
-        
-        numerator = sum((x[i] - x_mean) * (y[i] - y_mean) for i in range(n))
-        denominator = sum((x[i] - x_mean) ** 2 for i in range(n))
-        
-        if denominator == 0:
-            return "stable", 0.0
-        
-        slope = numerator / denominator
+        # Closed-form least squares slope: (nΣxy - ΣxΣy) / (nΣx² - (Σx)²)
+        slope = float(regression_slope(np.ascontiguousarray(values, dtype=np.float64)))
         
-        # Classify trend based on slope magnitude
+        return self._classify_trend(slope), slope
+    
+    def _classify_trend(self, slope: float) -> str:
+        """Classify trend based on slope magnitude"""
         if abs(slope) < 0.05:  # Less than 0.05 quality units per position
-            trend = "stable"
+            return "stable"
         elif slope < 0:
-            trend = "degrading"
+            return "degrading"
         else:
-            trend = "improving"
-        
-        return trend, slope
+            return "improving"
     
-    def calibrate_from_per_base_quality(self, per_base_quality: Dict) -> ThresholdCalibration:
+    def calibrate_from_per_base_quality(self, per_base_quality) -> ThresholdCalibration:
         """
         Main calibration algorithm.
         
+        Accepts the per_base_quality dict from parsed FastQC data, or an
+        array of per-position means (see extract_quality_means) to skip extraction.
+        
         Steps:
         1. Extract mean quality at each position
         2. Calculate distribution statistics (mean, std, median, MAD)
@@ -133,55 +203,34 @@ class AdaptiveThresholdCalibrator:
         5. Calibrate threshold based on overall quality level
         6. Estimate confidence based on data consistency
         """
-        if not per_base_quality:
-            return self._default_calibration()
-        
         # Step 1: Extract quality values
-        quality_values = []
-        for pos_data in per_base_quality.values():
-            if isinstance(pos_data, dict) and "mean" in pos_data:
-                quality_values.append(pos_data["mean"])
+        if isinstance(per_base_quality, np.ndarray):
+            quality_values = np.ascontiguousarray(per_base_quality, dtype=np.float64)
+        elif per_base_quality:
+            quality_values = extract_quality_means(per_base_quality)
+        else:
+            return self._default_calibration()
         
-        if not quality_values:
+        if quality_values.size == 0:
             return self._default_calibration()
         
         # Step 2: Distribution statistics
-        mean_q = statistics.mean(quality_values)
-        std_q = statistics.stdev(quality_values) if len(quality_values) > 1 else 0.0
-        median_q = statistics.median(quality_values)
-        mad = self.calculate_mad(quality_values)
+        mean_q = float(quality_values.mean())
+        std_q = float(quality_values.std(ddof=1)) if quality_values.size > 1 else 0.0
         
-        # Step 3: Outlier detection
-        outliers = self.detect_outliers_mad(quality_values)
+        # Step 3: Outlier detection (median and MAD come from the same pass)
+        median_q, mad, outliers = self._stats(quality_values)
         
         # Step 4: Trend detection
         trend, trend_rate = self.calculate_trend(quality_values)
         
         # Step 5: Adaptive threshold calibration
-        # If overall quality is high, use stricter thresholds
-        # If overall quality is low, adjust expectations
-        if mean_q >= 35:
-            # High quality data - use strict thresholds
-            recommended = self.baseline_thresholds["excellent"]
-            adjustment = 0
-        elif mean_q >= 30:
-            # Good quality - standard thresholds
-            recommended = self.baseline_thresholds["good"]
-            adjustment = 0
-        elif mean_q >= 25:
-            # Acceptable quality - slightly relaxed
-            recommended = self.baseline_thresholds["acceptable"]
-            adjustment = 0
-        else:
-            # Low quality - adaptive thresholds
-            # Don't fail everything just because baseline is low
-            recommended = max(20, mean_q - std_q)
-            adjustment = self.baseline_thresholds["acceptable"] - recommended
+        recommended = self._recommend_threshold(mean_q, std_q)
         
         # Step 6: Confidence estimation
         # High confidence: low std, few outliers, stable trend
         # Low confidence: high std, many outliers, degrading trend
-        confidence = self._estimate_confidence(std_q, len(outliers), len(quality_values), trend)
+        confidence = self._estimate_confidence(std_q, len(outliers), quality_values.size, trend)
         
         return ThresholdCalibration(
             mean_quality=mean_q,
@@ -195,6 +244,113 @@ class AdaptiveThresholdCalibrator:
             trend_rate=trend_rate
         )
     
+    def _recommend_threshold(self, mean_q, std_q):
+        """
+        Pick a threshold from the overall quality level.
+        
+        If overall quality is high, use stricter thresholds.
+        If overall quality is low, adjust expectations.
+        Accepts scalars or arrays (for batch calibration).
+        """
+        mean_q = np.asarray(mean_q, dtype=np.float64)
+        idx = np.searchsorted(self._thresh_cutoffs, mean_q, side='right') - 1
+        # Below the lowest cutoff: adaptive threshold so a low baseline doesn't fail everything
+        recommended = np.where(
+            idx >= 0,
+            self._thresh_values[np.maximum(idx, 0)],
+            np.maximum(20, mean_q - std_q)
+        )
+        return float(recommended) if recommended.ndim == 0 else recommended
+    
+    def calibrate_batch(self, samples: List) -> List[ThresholdCalibration]:
+        """
+        Calibrate many samples at once.
+        
+        Each sample is a per_base_quality dict or an array of per-position
+        means. Samples are stacked into a NaN-padded (n_samples, n_positions)
+        array so every statistic is computed along axis=1 in one NumPy call.
+        Results match calibrate_from_per_base_quality for each sample.
+        """
+        arrays = [
+            s.astype(np.float64, copy=False) if isinstance(s, np.ndarray)
+            else extract_quality_means(s) if s else np.empty(0)
+            for s in samples
+        ]
+        lengths = np.array([a.size for a in arrays], dtype=np.int64)
+        has_data = lengths > 0
+        
+        if not has_data.any():
+            return [self._default_calibration() for _ in samples]
+        
+        # Stack ragged samples, padding short rows with NaN
+        X = np.full((len(arrays), lengths.max()), np.nan)
+        for row, a in zip(X, arrays):
+            row[:a.size] = a
+        # Rows without data are all-NaN; give them a dummy value to avoid warnings
+        X[~has_data, 0] = 0.0
+        valid = ~np.isnan(X)
+        n = np.maximum(lengths, 1).astype(np.float64)
+        
+        # Distribution statistics
+        Y = np.where(valid, X, 0.0)
+        means = Y.sum(axis=1) / n
+        sq_dev = np.where(valid, (X - means[:, None]) ** 2, 0.0).sum(axis=1)
+        stds = np.sqrt(sq_dev / np.maximum(n - 1, 1))
+        stds[lengths < 2] = 0.0
+        medians = np.nanmedian(X, axis=1)
+        abs_dev = np.abs(X - medians[:, None])
+        mads = np.nanmedian(abs_dev, axis=1)
+        
+        # Outliers: NaN padding compares False, so it never lands in the mask
+        outlier_masks = abs_dev > 3.0 * mads[:, None]
+        outlier_masks[(lengths < 3) | (mads == 0)] = False
+        
+        # Row-wise closed-form regression over positions 0..n-1
+        x = np.arange(X.shape[1], dtype=np.float64)
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        sum_y = Y.sum(axis=1)
+        sum_xy = Y @ x
+        denominators = n * sum_xx - sum_x * sum_x
+        has_trend = (lengths >= 5) & (denominators != 0)
+        slopes = np.zeros(len(arrays))
+        slopes[has_trend] = (
+            (n * sum_xy - sum_x * sum_y)[has_trend] / denominators[has_trend]
+        )
+        # Same rule as _classify_trend; rows without a trend have slope 0 -> "stable"
+        trend_codes = np.where(np.abs(slopes) < 0.05, 0, np.where(slopes < 0, 1, 2))
+        trends = _TREND_LABELS[trend_codes]
+        
+        recommended = self._recommend_threshold(means, stds)
+        confidences = self._estimate_confidence_batch(
+            stds, outlier_masks.sum(axis=1), lengths, trend_codes
+        )
+        
+        results = []
+        for i in range(len(arrays)):
+            if not has_data[i]:
+                results.append(self._default_calibration())
+                continue
+            
+            mean_q = float(means[i])
+            std_q = float(stds[i])
+            outliers = np.nonzero(outlier_masks[i])[0].tolist()
+            trend = str(trends[i])
+            
+            results.append(ThresholdCalibration(
+                mean_quality=mean_q,
+                std_dev=std_q,
+                median=float(medians[i]),
+                mad=float(mads[i]),
+                recommended_threshold=float(recommended[i]),
+                confidence_level=str(confidences[i]),
+                outlier_positions=outliers,
+                trend=trend,
+                trend_rate=float(slopes[i])
+            ))
+        
+        return results
+    
     def _estimate_confidence(self, std: float, num_outliers: int, 
                            total_positions: int, trend: str) -> str:
         """
@@ -207,14 +363,31 @@ class AdaptiveThresholdCalibrator:
         # and outlier proportion
         outlier_ratio = num_outliers / total_positions if total_positions > 0 else 0
         
-        # High confidence: low variability, few outliers, stable trend
-        if std < 3.0 and outlier_ratio < 0.1 and trend == "stable":
-            return "high"
         # Low confidence: high variability, many outliers, or degrading trend
-        elif std > 8.0 or outlier_ratio > 0.3 or trend == "degrading":
-            return "low"
-        else:
-            return "medium"
+        low = (std > 8.0) | (outlier_ratio > 0.3) | (trend == "degrading")
+        # High confidence: low variability, few outliers, stable trend
+        score = (std < 3.0) + (outlier_ratio < 0.1) + (trend == "stable")
+        
+        return "low" if low else ("high" if score == 3 else "medium")
+    
+    def _estimate_confidence_batch(self, stds: np.ndarray, num_outliers: np.ndarray,
+                                   lengths: np.ndarray, trend_codes: np.ndarray) -> np.ndarray:
+        """
+        Array form of _estimate_confidence for calibrate_batch.
+        
+        Takes per-sample stds, outlier counts, lengths and trend codes
+        (indices into _TREND_LABELS) and returns confidence labels.
+        """
+        outlier_ratios = np.divide(
+            num_outliers, lengths,
+            out=np.zeros(len(lengths)), where=lengths > 0
+        )
+        
+        # Same rules as _estimate_confidence, one mask per condition
+        low = (stds > 8.0) | (outlier_ratios > 0.3) | (trend_codes == 1)
+        high = (stds < 3.0) & (outlier_ratios < 0.1) & (trend_codes == 0)
+        codes = np.where(low, 0, np.where(high, 2, 1))
+        return _CONFIDENCE_LABELS[codes]
     
     def _default_calibration(self) -> ThresholdCalibration:
         """Return default calibration when no data available"""
@@ -234,39 +407,42 @@ class AdaptiveThresholdCalibrator:
         """
         Generate human-readable interpretation of calibration results.
         """
-        interpretation = []
+        mean_q = calibration.mean_quality
+        std = calibration.std_dev
         
         # Overall quality assessment
-        if calibration.mean_quality >= 35:
-            interpretation.append("High quality data (mean Q={:.1f})".format(calibration.mean_quality))
-        elif calibration.mean_quality >= 30:
-            interpretation.append("Good quality data (mean Q={:.1f})".format(calibration.mean_quality))
-        elif calibration.mean_quality >= 25:
-            interpretation.append("Acceptable quality data (mean Q={:.1f})".format(calibration.mean_quality))
+        if mean_q >= 35:
+            quality_level = "High"
+        elif mean_q >= 30:
+            quality_level = "Good"
+        elif mean_q >= 25:
+            quality_level = "Acceptable"
         else:
-            interpretation.append("Low quality data (mean Q={:.1f})".format(calibration.mean_quality))
+            quality_level = "Low"
         
         # Consistency assessment
-        if calibration.std_dev < 3.0:
-            interpretation.append("Very consistent quality across positions")
-        elif calibration.std_dev < 6.0:
-            interpretation.append("Moderate variation in quality")
+        if std < 3.0:
+            consistency = "Very consistent quality across positions"
+        elif std < 6.0:
+            consistency = "Moderate variation in quality"
         else:
-            interpretation.append("High variation in quality (std={:.1f})".format(calibration.std_dev))
+            consistency = f"High variation in quality (std={std:.1f})"
         
         # Trend information
         if calibration.trend == "degrading":
-            interpretation.append("Quality degrades along read (rate={:.3f}/position)".format(abs(calibration.trend_rate)))
+            trend = f"Quality degrades along read (rate={abs(calibration.trend_rate):.3f}/position)"
         elif calibration.trend == "improving":
-            interpretation.append("Quality improves along read (unusual)")
+            trend = "Quality improves along read (unusual)"
         else:
-            interpretation.append("Stable quality across read length")
+            trend = "Stable quality across read length"
+        
+        interpretation = [f"{quality_level} quality data (mean Q={mean_q:.1f})", consistency, trend]
         
         # Outlier information
-        if len(calibration.outlier_positions) > 0:
-            interpretation.append("{} outlier positions detected".format(len(calibration.outlier_positions)))
+        if calibration.outlier_positions:
+            interpretation.append(f"{len(calibration.outlier_positions)} outlier positions detected")
         
         # Confidence
-        interpretation.append("Confidence: {}".format(calibration.confidence_level))
+        interpretation.append(f"Confidence: {calibration.confidence_level}")
         
         return ". ".join(interpretation) + "."
@@ -1,15 +1,17 @@
 
 
-import json
 import os
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field, asdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Any, Optional, Iterable, Iterator
+from dataclasses import dataclass, field
 
 from phredator.rules.qc_rules import QCRulesEngine, QCStatus
+from phredator.utils.helpers import load_json, dumps_json, DATACLASS_SLOTS
 from phredator.utils.profile_loader import ProfileLoader
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class QCAnalysisResult:
     """Results from QC analysis"""
     sample_name: str
@@ -23,16 +25,26 @@ class QCAnalysisResult:
     
     def to_json(self) -> str:
 
-        return json.dumps(asdict(self), indent=4)
+        return dumps_json(self.to_dict(), indent=4)
     
     def to_dict(self) -> Dict[str, Any]:
-
-        return asdict(self)
+        # Built by hand: asdict() reflects over fields and deep-copies containers
+        return {
+            "sample_name": self.sample_name,
+            "overall_status": self.overall_status,
+            "overall_summary": self.overall_summary,
+            "metrics": self.metrics,
+            "all_recommendations": self.all_recommendations,
+            "organism": self.organism,
+            "experiment_type": self.experiment_type,
+            "profile_info": self.profile_info,
+        }
 
 
 class Analyzer:
     
-    def __init__(self, input_path: str, expected_gc: float = 50.0, organism: Optional[str] = None, experiment_type: Optional[str] = None):
+    def __init__(self, input_path: str, expected_gc: float = 50.0, organism: Optional[str] = None, experiment_type: Optional[str] = None,
+                 thresholds: Optional[Dict[str, Any]] = None):
         self.input_path = input_path
         self.expected_gc = expected_gc
         self.organism = organism
@@ -40,20 +52,27 @@ class Analyzer:
         self.parsed_data = None
         self.sample_name = "Unknown"
         self.profile_loader = ProfileLoader()
-        self.thresholds = self.profile_loader.get_combined_thresholds(organism, experiment_type)
+        # Callers analyzing many samples with one profile (batch mode) pass the
+        # combined thresholds in, so the profile YAML is read once, not per sample
+        if thresholds is None:
+            thresholds = self.profile_loader.get_combined_thresholds(organism, experiment_type)
+        self.thresholds = thresholds
         
         # Initialize rules engine with custom thresholds
         self.rules_engine = QCRulesEngine(thresholds=self.thresholds)
         if organism and 'gc_content' in self.thresholds:
             self.expected_gc = self.thresholds['gc_content'].get('mean', expected_gc)
         
+        # Profile names shown in the result, resolved once
+        self._organism_name = self.thresholds.get('organism_name', organism)
+        self._experiment_name = self.thresholds.get('experiment_name', experiment_type)
+        
     def load_data(self) -> Dict[str, Any]:
 
         if not os.path.exists(self.input_path):
             raise FileNotFoundError(f"Input file not found: {self.input_path}")
         
-        with open(self.input_path, 'r') as f:
-            data = json.load(f)
+        data = load_json(self.input_path)
         
         # Validate required fields
         required_fields = ["sample_name"]
@@ -77,20 +96,28 @@ class Analyzer:
         # Dictionary to store individual metric results
         individual_results = {}
         all_recommendations = []
+        seen_recommendations = set()
+        
+        def add_recommendations(recommendations: List[str]):
+            # Remove duplicates, preserve order
+            for rec in recommendations:
+                if rec not in seen_recommendations:
+                    seen_recommendations.add(rec)
+                    all_recommendations.append(rec)
         
         # Analyze per-base quality
         per_base_quality = self.parsed_data.get("per_base_quality", {})
         if per_base_quality:
             status, summary, recommendations = self.rules_engine.evaluate_per_base_quality(per_base_quality)
             individual_results["per_base_quality"] = (status, summary, recommendations)
-            all_recommendations.extend(recommendations)
+            add_recommendations(recommendations)
         
         # Analyze GC content (use mean from distribution)
         gc_content_mean = self.parsed_data.get("gc_content_mean", 0)
         if gc_content_mean > 0:
             status, summary, recommendations = self.rules_engine.evaluate_gc_content(gc_content_mean, self.expected_gc)
             individual_results["gc_content"] = (status, summary, recommendations)
-            all_recommendations.extend(recommendations)
+            add_recommendations(recommendations)
         
         # Analyze duplication levels
         duplication_levels = self.parsed_data.get("duplication_levels", {})
@@ -102,19 +129,19 @@ class Analyzer:
             duplication_percentage = 100.0 - total_dedup_pct
             status, summary, recommendations = self.rules_engine.evaluate_duplication(duplication_levels)
             individual_results["duplication_levels"] = (status, summary, recommendations)
-            all_recommendations.extend(recommendations)
+            add_recommendations(recommendations)
         
         # Analyze adapter content
         adapter_content = self.parsed_data.get("adapter_content", {})
         status, summary, recommendations = self.rules_engine.evaluate_adapter_content(adapter_content)
         individual_results["adapter_content"] = (status, summary, recommendations)
-        all_recommendations.extend(recommendations)
+        add_recommendations(recommendations)
         
         # Analyze overrepresented sequences
         overrepresented_sequences = self.parsed_data.get("overrepresented_sequences", [])
         status, summary, recommendations = self.rules_engine.evaluate_overrepresented_sequences(overrepresented_sequences)
         individual_results["overrepresented_sequences"] = (status, summary, recommendations)
-        all_recommendations.extend(recommendations)
+        add_recommendations(recommendations)
         
         # Generate overall assessment
         overall_status, overall_summary = self.rules_engine.generate_overall_assessment(individual_results)
@@ -129,16 +156,16 @@ class Analyzer:
             }
         profile_info = []
         if self.organism:
-            profile_info.append(f"Organism: {self.thresholds.get('organism_name', self.organism)}")
+            profile_info.append(f"Organism: {self._organism_name}")
         if self.experiment_type:
-            profile_info.append(f"Experiment: {self.thresholds.get('experiment_name', self.experiment_type)}")
+            profile_info.append(f"Experiment: {self._experiment_name}")
         
         result = QCAnalysisResult(
             sample_name=self.sample_name,
             overall_status=overall_status.value,
             overall_summary=overall_summary,
             metrics=metrics,
-            all_recommendations=list(dict.fromkeys(all_recommendations)),  # Remove duplicates, preserve order
+            all_recommendations=all_recommendations,
             organism=self.organism,
             experiment_type=self.experiment_type,
             profile_info=" | ".join(profile_info) if profile_info else None
@@ -150,3 +177,24 @@ class Analyzer:
 
         self.load_data()
         return self.analyze()
+    
+    @classmethod
+    def run_many(cls, input_paths: Iterable[str], n_jobs: int = 1, **kwargs) -> Iterator[QCAnalysisResult]:
+        """
+        Analyze many parsed samples, yielding results in input order.
+        
+        Samples are independent, so with n_jobs > 1 they are spread over a
+        process pool. kwargs are passed to the Analyzer constructor.
+        """
+        analyze_one = partial(_analyze_one, **kwargs)
+        if n_jobs <= 1:
+            yield from map(analyze_one, input_paths)
+            return
+        
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            yield from executor.map(analyze_one, input_paths, chunksize=8)
+
+
+def _analyze_one(input_path: str, **kwargs) -> QCAnalysisResult:
+    # Module-level so it can be pickled into worker processes
+    return Analyzer(input_path, **kwargs).run()
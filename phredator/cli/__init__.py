@@ -5,6 +5,13 @@ This package exposes a `main` symbol so entry points that refer to
 in `phredator.cli.cli`.
 """
 
-from .cli import main
-
 __all__ = ["main"]
+
+
+def __getattr__(name):
+    # Defer importing the CLI (and the analyzer stack behind it) until
+    # `main` is actually requested (PEP 562).
+    if name == "main":
+        from .cli import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,128 @@
+# phredator/cli/_examples.py
+# Text for `phredator examples`; imported only by that subcommand.
+
+EXAMPLES_TEXT = """
+//================================================================\\\\
+||              PHREDATOR USAGE EXAMPLES                          ||
+\\\\================================================================//
+
+SINGLE FILE PROCESSING (parse → analyze → fix)
+-----------------------------------------------
+Process one sample at a time through the pipeline.
+Good for: Exploratory analysis, debugging, testing
+
+Example workflow:
+  # Step 1: Parse FastQC output
+  $ phredator parse sample1_fastqc.zip --output sample1.json
+
+  # Step 2: Analyze with organism/experiment profiles
+  $ phredator analyze sample1.json \\
+      --organism human \\
+      --experiment-type chipseq \\
+      --output analysis1.json
+
+  # Step 3: Generate fix suggestions
+  $ phredator fix analysis1.json \\
+      --input-reads sample1.fastq.gz \\
+      --output fixes1.json
+
+  Each command shows detailed output with [PASS]/[WARN]/[FAIL] status
+  and saves a .log file alongside the .json file.
+
+
+BATCH PROCESSING (all at once)
+-------------------------------
+Process multiple samples in one command.
+Good for: Production runs, many samples, reproducibility
+
+Method 1: From a list file
+  # Create a sample list file
+  $ cat > samples.txt << EOF
+/path/to/sample1_fastqc.zip
+/path/to/sample2_fastqc.zip
+/path/to/sample3_fastqc.zip
+EOF
+
+  # Process all samples
+  $ phredator batch samples.txt \\
+      --organism human \\
+      --experiment-type rnaseq \\
+      --output-dir batch_results/ \\
+      --parallel 4
+
+Method 2: Multiple files directly
+  # Pass files directly on command line
+  $ phredator batch sample1_fastqc.zip sample2_fastqc.zip sample3_fastqc.zip \\
+      --organism human \\
+      --experiment-type rnaseq \\
+      --output-dir batch_results/ \\
+      --parallel 4
+
+Method 3: Using wildcards (shell expansion)
+  # Process all FastQC files in directory
+  $ phredator batch results/qc/*_fastqc.zip \\
+      --organism human \\
+      --experiment-type rnaseq \\
+      --output-dir batch_results/ \\
+      --parallel 4
+
+  Output:
+    Processed 96 samples:
+    [PASS] 78 (81%)
+    [WARN] 12 (13%)
+    [FAIL] 6 (6%)
+
+    Average metrics:
+    - GC content: 41.2% ± 2.3%
+    - Quality: Q38.5 ± 1.2
+    - Duplication: 65.3% ± 18.9% (normal for RNA-seq)
+
+    Outliers:
+    - Sample_23: GC content = 35.0% (possible contamination)
+    - Sample_67: Quality = Q22.0 (resequence recommended)
+
+
+FUZZY MATCHING
+--------------
+Phredator accepts natural input for organism and experiment types:
+
+  "Human" → human
+  "chip-seq" → chipseq
+  "RNA seq" → rnaseq
+
+See all available profiles:
+  $ phredator list-organisms
+  $ phredator list-organisms --detailed
+
+
+REAL-WORLD EXAMPLE
+------------------
+You have 16 ChIP-seq samples in ~/MEF2C_ChIPseq/results/qc/:
+
+Method 1: Quick batch with wildcards
+  $ phredator batch ~/MEF2C_ChIPseq/results/qc/*_fastqc.zip \\
+      --organism human \\
+      --experiment-type chipseq \\
+      --output-dir chipseq_qc/ \\
+      --parallel 4
+
+Method 2: Using a list file
+  $ ls ~/MEF2C_ChIPseq/results/qc/*_fastqc.zip > chipseq_samples.txt
+  $ phredator batch chipseq_samples.txt \\
+      --organism human \\
+      --experiment-type chipseq \\
+      --output-dir chipseq_qc/ \\
+      --parallel 4
+
+Method 3: Individual sample inspection
+  $ phredator parse ~/MEF2C_ChIPseq/results/qc/SRR35220282_1_fastqc.zip \\
+      --output sample.json
+  $ phredator analyze sample.json \\
+      --organism human \\
+      --experiment-type chipseq \\
+      --output analysis.json
+
+//================================================================\\\\
+||  Need more help? Use --help with any command for details      ||
+\\\\================================================================//
+"""
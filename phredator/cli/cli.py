@@ -1,40 +1,287 @@
 # phredator/cli/cli.py
 import argparse
-import os
+import heapq
 import sys
 import json
+from collections import Counter
+from itertools import chain, islice
 from pathlib import Path
 
-from phredator.parser.fastqc_parser import FastQCParser
-from phredator.parser.batch_parser import BatchParser
-from phredator.parser.batch_processor import BatchProcessor
-from phredator.analyzer.qc_analyzer import Analyzer
-from phredator.fixer.qc_fixer import Fixer
-from phredator.reporter.report_generator import Reporter
-from phredator.pipeline.pipeline_runner import PipelineRunner
-from phredator.utils.profile_loader import ProfileLoader
-
-def main():
-    parser = argparse.ArgumentParser(
-        prog="phredator",
-        description="Phredator: Rule-based QC toolkit for sequencing data"
+# Subcommand implementations are imported inside their branches of main()
+# so each invocation only loads the modules it actually uses.
+
+# ANSI color codes
+_RED = '\033[31m'  # Dark red instead of bright red
+_BOLD = '\033[1m'
+_RESET = '\033[0m'
+
+# Static pieces of the analyze/fix/batch terminal summaries (Subread-style)
+_PHREDATOR_BANNER = "\n".join([
+    "",
+    f"{_RED}{_BOLD}",
+    "  ██████╗ ██╗  ██╗██████╗ ███████╗██████╗  ██████╗ ████████╗ ██████╗ ██████╗ ",
+    "  ██╔══██╗██║  ██║██╔══██╗██╔════╝██╔══██╗██╔═══██╗╚══██╔══╝██╔═══██╗██╔══██╗",
+    "  ██████╔╝███████║██████╔╝█████╗  ██║  ██║███████║   ██║   ██║   ██║██████╔╝",
+    "  ██╔═══╝ ██╔══██║██╔══██╗██╔══╝  ██║  ██║██╔══██║   ██║   ██║   ██║██╔══██╗",
+    "  ██║     ██║  ██║██║  ██║███████╗██████╔╝██║  ██║   ██║   ╚██████╔╝██║  ██║",
+    "  ╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝╚═════╝ ╚═╝  ╚═╝   ╚═╝    ╚═════╝ ╚═╝  ╚═╝",
+    f"{_RESET}",
+])
+
+_BOX_TOP = "//================================\\\\"
+_BOX_BOTTOM = "\\\\================================//"
+
+
+def _box_header(title_line: str) -> str:
+    return f"{_BOX_TOP}\n{title_line}\n{_BOX_BOTTOM}"
+
+
+_HDR_QC = _box_header("||       QC Analysis Report       ||")
+_HDR_ASSESSMENTS = _box_header("||    Quality Assessments         ||")
+_HDR_RECS = _box_header("||       Recommendations          ||")
+_HDR_FIXES = _box_header("||     Fix Suggestions Report     ||")
+_HDR_ACTIONS = _box_header("||    Recommended Actions         ||")
+_HDR_PIPELINE = _box_header("||      Suggested Pipeline        ||")
+_HDR_BATCH = _box_header("||   Batch Processing Summary     ||")
+_HDR_SAMPLES = _box_header("||      Sample Details            ||")
+_HDR_METRICS = _box_header("||      Average Metrics           ||")
+_HDR_OUTLIERS = _box_header("||         Outliers               ||")
+_HDR_BATCH_RECS = _box_header("||      Recommendations           ||")
+
+# Per-sample metrics shown in the batch summary, in display order, with their labels
+_BATCH_METRIC_DISPLAY = tuple(
+    (metric_key, metric_key.replace('_', ' ').title())
+    for metric_key in (
+        'per_base_quality',
+        'gc_content',
+        'duplication_levels',
+        'adapter_content',
+        'overrepresented_sequences',
+        'per_base_n_content',
+        'sequence_length_distribution',
+        'per_sequence_quality',
+        'per_tile_quality',
+        'per_sequence_gc_content',
+        'kmer_content',
     )
-    subparsers = parser.add_subparsers(dest="command", required=True)
+)
+_METRIC_STATUS_SYMBOLS = {'PASS': "[PASS]", 'WARN': "[WARN]", 'FAIL': "[FAIL]"}
+
+# Distinct recommendations counted for the batch summary before one-offs are dropped
+_MAX_TRACKED_RECOMMENDATIONS = 10_000
+
+
+def _iter_sample_list(path):
+    with open(path, 'r') as f:
+        for line in f:
+            sample = line.strip()
+            if sample and not line.startswith('#'):
+                yield sample
+
+
+def _iter_batch_summary_lines(report, args, out_dir: Path):
+    # Generate professional terminal summary with red Phredator title
+    yield _PHREDATOR_BANNER
+    yield ""
+    yield _HDR_BATCH
+    yield ""
+    yield f"   Processed {report.successful}/{report.total_samples} samples:"
+
+    if report.statistics:
+        stats = report.statistics
+        total_processed = stats.pass_count + stats.warn_count + stats.fail_count
+
+        if total_processed > 0:
+            pass_pct = (stats.pass_count / total_processed) * 100
+            warn_pct = (stats.warn_count / total_processed) * 100
+            fail_pct = (stats.fail_count / total_processed) * 100
+
+            yield f"   [PASS] {stats.pass_count} ({pass_pct:.0f}%)"
+            yield f"   [WARN] {stats.warn_count} ({warn_pct:.0f}%)"
+            yield f"   [FAIL] {stats.fail_count} ({fail_pct:.0f}%)"
+
+    if report.failed > 0:
+        yield f"   Failed  : {report.failed} samples"
+    if report.skipped > 0:
+        yield f"   Skipped : {report.skipped} samples"
+
+    # Show per-sample details
+    yield ""
+    yield _HDR_SAMPLES
+    yield ""
+
+    # Only the samples shown below keep their parsed analysis JSON; the
+    # recommendations reuse them and stream the remaining files
+    shown_paths = [r.analysis_json for r in islice(report.sample_results, 20)
+                   if r.status == "success" and r.analysis_json]
+    sample_analyses = {path: analysis_data for path, analysis_data in _iter_sample_analyses(shown_paths)
+                       if analysis_data is not None}
+
+    for sample_result in islice(report.sample_results, 20):  # Show first 20 samples
+        analysis_data = sample_analyses.get(sample_result.analysis_json)
+        if analysis_data is not None:
+            try:
+                status_symbol = "[PASS]" if sample_result.overall_status.upper() == "PASS" else "[WARN]" if sample_result.overall_status.upper() == "WARN" else "[FAIL]"
+                yield from (f"   {status_symbol} {sample_result.sample_name}", "")
+
+                # Show ALL metrics with status symbols
+                if 'metrics' in analysis_data:
+                    metrics = analysis_data['metrics']
+                    yield from _batch_metric_lines(metrics)
+
+                yield ""
+            except (AttributeError, KeyError, TypeError) as e:  # malformed analysis JSON
+                if args.verbose:
+                    print(f"[WARNING] Skipping details for {sample_result.sample_name}: {e}")
+
+    if len(report.sample_results) > 20:
+        yield f"   ... and {len(report.sample_results) - 20} more samples"
+        yield ""
+
+    yield ""
+    yield _HDR_METRICS
+    yield ""
+
+    if report.statistics:
+        stats = report.statistics
+
+        if stats.gc_mean is not None:
+            gc_display = f"{stats.gc_mean:.1f}%"
+            if stats.gc_std is not None:
+                gc_display += f" ± {stats.gc_std:.1f}%"
+            yield f"   GC content   : {gc_display}"
+
+        if stats.quality_mean is not None:
+            q_display = f"Q{stats.quality_mean:.1f}"
+            if stats.quality_std is not None:
+                q_display += f" ± {stats.quality_std:.1f}"
+            yield f"   Quality      : {q_display}"
+
+        if stats.duplication_mean is not None:
+            dup_display = f"{stats.duplication_mean:.1f}%"
+            if stats.duplication_std is not None:
+                dup_display += f" ± {stats.duplication_std:.1f}%"
+
+            # Add context for duplication based on experiment type
+            context = ""
+            if args.experiment_type and 'rna' in args.experiment_type.lower():
+                context = " (normal for RNA-seq)"
+            elif args.experiment_type and 'chip' in args.experiment_type.lower():
+                context = " (expected for ChIP-seq)"
+
+            yield f"   Duplication  : {dup_display}{context}"
+
+        # Show outliers if any
+        if stats.outliers:
+            yield ""
+            yield _HDR_OUTLIERS
+            yield ""
+
+            for outlier in islice(stats.outliers, 10):
+                yield f"   {outlier['sample']:20s} : {outlier['metric']} = {outlier['value']} ({outlier['reason']})"
+
+            if len(stats.outliers) > 10:
+                yield f"   ... and {len(stats.outliers) - 10} more outliers"
+
+    # Count how many samples share each recommendation
+    all_recommendations = Counter()
+    remaining_paths = (r.analysis_json for r in islice(report.sample_results, 20, None)
+                       if r.status == "success" and r.analysis_json)
+    remaining_analyses = (analysis_data for _, analysis_data in _iter_sample_analyses(remaining_paths))
+    # Once the counter has been trimmed, counts and the distinct total are
+    # only lower bounds (an evicted recommendation restarts at 1)
+    trimmed = False
+    analyzed_count = 0
+    for analysis_data in chain(sample_analyses.values(), remaining_analyses):
+        if analysis_data is None:
+            continue
+        analyzed_count += 1
+        # Count each recommendation once per sample
+        all_recommendations.update(set(analysis_data.get('all_recommendations', ())))
+        # Keep memory bounded on highly varied recommendation text: evict the
+        # least common recommendations down to half the limit, so trims stay
+        # rare even when most entries have been seen more than once
+        if len(all_recommendations) > _MAX_TRACKED_RECOMMENDATIONS:
+            all_recommendations = Counter(
+                dict(all_recommendations.most_common(_MAX_TRACKED_RECOMMENDATIONS // 2))
+            )
+            trimmed = True
+
+    # Show the most common recommendations first (ties alphabetically)
+    if all_recommendations:
+        yield ""
+        yield _HDR_BATCH_RECS
+        yield ""
+
+        top_recommendations = heapq.nsmallest(10, all_recommendations.items(),
+                                              key=lambda item: (-item[1], item[0]))
+        at_least = "≥" if trimmed else ""
+        for i, (rec, count) in enumerate(top_recommendations, 1):
+            yield f"   {i}. {rec} ({at_least}{count}/{analyzed_count} samples)"
+
+        if trimmed:
+            yield "   ... and more recommendations"
+        elif len(all_recommendations) > 10:
+            yield f"   ... and {len(all_recommendations) - 10} more recommendations"
+
+    yield ""
+    yield _BOX_TOP
+    yield f"   Output : {out_dir}"
+    yield f"   Report : {out_dir / 'batch_report.json'}"
+    yield _BOX_BOTTOM
+    yield ""
+
+
+def _iter_sample_analyses(paths, window: int = 64):
+    # Yield (path, parsed analysis or None), reading a few files at a time
+    # (the reads are I/O-bound) but only a window of them ahead, so memory
+    # does not grow with the batch size
+    from concurrent.futures import ThreadPoolExecutor
+    paths = iter(paths)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        while True:
+            batch = list(islice(paths, window))
+            if not batch:
+                return
+            yield from zip(batch, executor.map(_load_sample_analysis, batch))
+
+
+def _load_sample_analysis(path: str):
+    from phredator.utils.helpers import load_json
+    try:
+        return load_json(path)
+    except (OSError, ValueError):  # missing/unreadable file or malformed JSON
+        return None
 
-    # ---------------- Examples ----------------
-    examples_parser = subparsers.add_parser("examples", help="Show usage examples for single file and batch processing")
 
-    # ---------------- List Organisms ----------------
+def _batch_metric_lines(metrics: dict) -> list:
+    lines = []
+    for metric_key, metric_name in _BATCH_METRIC_DISPLAY:
+        metric = metrics.get(metric_key)
+        if metric is None:
+            continue
+        symbol = _METRIC_STATUS_SYMBOLS.get(metric.get('status', '').upper(), "[INFO]")
+        lines.append(f"      {symbol} {metric_name:30s} : {metric.get('summary', '')}")
+    return lines
+
+
+def _add_examples_parser(subparsers):
+    subparsers.add_parser("examples", help="Show usage examples for single file and batch processing")
+
+
+def _add_list_organisms_parser(subparsers):
     list_orgs_parser = subparsers.add_parser("list-organisms", help="List all available organism profiles")
     list_orgs_parser.add_argument("--detailed", action="store_true", help="Show detailed GC content and thresholds")
 
-    # ---------------- Parse ----------------
+
+def _add_parse_parser(subparsers):
     parse_parser = subparsers.add_parser("parse", help="Parse FastQC/MultiQC data")
     parse_parser.add_argument("input_path", type=str, help="Path to FastQC zip/folder or MultiQC JSON (multiqc_data.json)")
     parse_parser.add_argument("--output", type=str, default="parsed.json", help="Output file")
     parse_parser.add_argument("--verbose", action="store_true", help="Verbose logging")
 
-    # ---------------- Analyze ----------------
+
+def _add_analyze_parser(subparsers):
     analyze_parser = subparsers.add_parser("analyze", help="Analyze QC metrics using rule-based assessment")
     analyze_parser.add_argument("input_path", type=str, help="Path to parsed data (JSON)")
     analyze_parser.add_argument("--output", type=str, default="analysis.json", help="Output file")
@@ -45,7 +292,8 @@ def main():
                                 help="Experiment type (wgs, wes, rnaseq, chipseq, metagenomics) - fuzzy matching supported!")
     analyze_parser.add_argument("--verbose", action="store_true", help="Verbose logging")
 
-    # ---------------- Fix ----------------
+
+def _add_fix_parser(subparsers):
     fix_parser = subparsers.add_parser("fix", help="Generate automated fix suggestions")
     fix_parser.add_argument("input_path", type=str, help="Path to analysis data (JSON)")
     fix_parser.add_argument("--output", type=str, default="fixes.json", help="Output file")
@@ -54,14 +302,16 @@ def main():
     fix_parser.add_argument("--show-tool-status", action="store_true", help="Display tool availability status")
     fix_parser.add_argument("--verbose", action="store_true", help="Verbose logging")
 
-    # ---------------- Report ----------------
+
+def _add_report_parser(subparsers):
     report_parser = subparsers.add_parser("report", help="Generate comprehensive QC report")
     report_parser.add_argument("input_path", type=str, help="Path to data to report on (parsed/analysis/fixes JSON)")
     report_parser.add_argument("--output", type=str, default="report.json", help="Output file")
     report_parser.add_argument("--format", choices=["json", "csv", "summary"], default="json", help="Output format")
     report_parser.add_argument("--verbose", action="store_true", help="Verbose logging")
 
-    # ---------------- Batch ----------------
+
+def _add_batch_parser(subparsers):
     batch_parser = subparsers.add_parser("batch", help="Process multiple samples in batch")
     batch_parser.add_argument("samples", type=str, nargs='+', help="FastQC files/zips OR path to sample list file (one per line)")
     batch_parser.add_argument("--organism", type=str, help="Organism profile for all samples")
@@ -69,11 +319,15 @@ def main():
                              help="Experiment type (wgs, wes, rnaseq, chipseq, metagenomics) - fuzzy matching supported!")
     batch_parser.add_argument("--output-dir", type=str, default="batch_output", help="Output directory")
     batch_parser.add_argument("--parallel", type=int, default=1, help="Number of parallel processes (default: 1)")
+    batch_parser.add_argument("--batch-chunk-size", type=int, default=None,
+                              help="Samples handed to a parallel worker at a time "
+                                   "(default: about four chunks per worker; 16 for sample list files)")
     batch_parser.add_argument("--check-tools", action="store_true", default=True, help="Check tool availability")
     batch_parser.add_argument("--dry-run", action="store_true", help="Show what would be done without executing")
     batch_parser.add_argument("--verbose", action="store_true", help="Verbose logging")
 
-    # ---------------- Pipeline ----------------
+
+def _add_pipeline_parser(subparsers):
     pipeline_parser = subparsers.add_parser("pipeline", help="Run complete QC workflow with verification")
     pipeline_parser.add_argument("input_fastq", type=str, help="Path to input FASTQ file (must have FastQC results)")
     pipeline_parser.add_argument("--output-dir", type=str, default="pipeline_output", help="Output directory")
@@ -85,162 +339,78 @@ def main():
     pipeline_parser.add_argument("--dry-run", action="store_true", help="Show what would be done without executing")
     pipeline_parser.add_argument("--verbose", action="store_true", help="Verbose logging")
 
+
+_SUBPARSER_BUILDERS = {
+    "examples": _add_examples_parser,
+    "list-organisms": _add_list_organisms_parser,
+    "parse": _add_parse_parser,
+    "analyze": _add_analyze_parser,
+    "fix": _add_fix_parser,
+    "report": _add_report_parser,
+    "batch": _add_batch_parser,
+    "pipeline": _add_pipeline_parser,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="phredator",
+        description="Phredator: Rule-based QC toolkit for sequencing data"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    # Only build the requested subcommand (plus the tiny examples/list-organisms).
+    # Unknown commands, --help and no arguments get every subparser so that
+    # help text and error messages list all choices.
+    cmd = sys.argv[1] if len(sys.argv) > 1 else None
+    wanted = {cmd, "examples", "list-organisms"} if cmd in _SUBPARSER_BUILDERS else None
+    for name, add_subparser in _SUBPARSER_BUILDERS.items():
+        if wanted is None or name in wanted:
+            add_subparser(subparsers)
+
     args = parser.parse_args()
 
-    # Friendly fuzzy matching for organism and experiment-type
-    fuzzy_loader = ProfileLoader()
-    
-    if hasattr(args, 'organism') and args.organism:
-        original_input = args.organism
-        available = fuzzy_loader.list_organisms()
-        matched = fuzzy_loader._find_closest_match(args.organism, available)
+    # Summaries are written in a few large blocks and flushed once each, so
+    # stdout need not flush every line; verbose runs keep line buffering so
+    # per-sample progress still appears as it happens
+    if not getattr(args, 'verbose', False) and hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
+    # Friendly fuzzy matching for organism and experiment-type. The loader is
+    # only needed when one of them was given.
+    if getattr(args, 'organism', None) or getattr(args, 'experiment_type', None):
+        from phredator.utils.profile_loader import ProfileLoader
+        fuzzy_loader = ProfileLoader()
         
-        if matched and matched != original_input:
-            print(f"\nINFO: Using organism profile '{matched}' (matched from '{original_input}')")
-            args.organism = matched
-        elif matched:
-            args.organism = matched
-    
-    if hasattr(args, 'experiment_type') and args.experiment_type:
-        original_input = args.experiment_type
-        available = fuzzy_loader.list_experiment_types()
-        matched = fuzzy_loader._find_closest_match(args.experiment_type, available)
+        if getattr(args, 'organism', None):
+            original_input = args.organism
+            available = fuzzy_loader.list_organisms()
+            matched = fuzzy_loader._find_closest_match(args.organism, available)
+            
+            if matched and matched != original_input:
+                print(f"\nINFO: Using organism profile '{matched}' (matched from '{original_input}')")
+                args.organism = matched
+            elif matched:
+                args.organism = matched
         
-        if matched and matched != original_input:
-            print(f"INFO: Using experiment type '{matched}' (matched from '{original_input}')")
-            args.experiment_type = matched
-        elif matched:
-            args.experiment_type = matched
+        if getattr(args, 'experiment_type', None):
+            original_input = args.experiment_type
+            available = fuzzy_loader.list_experiment_types()
+            matched = fuzzy_loader._find_closest_match(args.experiment_type, available)
+            
+            if matched and matched != original_input:
+                print(f"INFO: Using experiment type '{matched}' (matched from '{original_input}')")
+                args.experiment_type = matched
+            elif matched:
+                args.experiment_type = matched
 
     try:
         if args.command == "examples":
-            print("""
-//================================================================\\\\
-||              PHREDATOR USAGE EXAMPLES                          ||
-\\\\================================================================//
-
-SINGLE FILE PROCESSING (parse → analyze → fix)
------------------------------------------------
-Process one sample at a time through the pipeline.
-Good for: Exploratory analysis, debugging, testing
-
-Example workflow:
-  # Step 1: Parse FastQC output
-  $ phredator parse sample1_fastqc.zip --output sample1.json
-
-  # Step 2: Analyze with organism/experiment profiles
-  $ phredator analyze sample1.json \\
-      --organism human \\
-      --experiment-type chipseq \\
-      --output analysis1.json
-
-  # Step 3: Generate fix suggestions
-  $ phredator fix analysis1.json \\
-      --input-reads sample1.fastq.gz \\
-      --output fixes1.json
-
-  Each command shows detailed output with [PASS]/[WARN]/[FAIL] status
-  and saves a .log file alongside the .json file.
-
-
-BATCH PROCESSING (all at once)
--------------------------------
-Process multiple samples in one command.
-Good for: Production runs, many samples, reproducibility
-
-Method 1: From a list file
-  # Create a sample list file
-  $ cat > samples.txt << EOF
-/path/to/sample1_fastqc.zip
-/path/to/sample2_fastqc.zip
-/path/to/sample3_fastqc.zip
-EOF
-
-  # Process all samples
-  $ phredator batch samples.txt \\
-      --organism human \\
-      --experiment-type rnaseq \\
-      --output-dir batch_results/ \\
-      --parallel 4
-
-Method 2: Multiple files directly
-  # Pass files directly on command line
-  $ phredator batch sample1_fastqc.zip sample2_fastqc.zip sample3_fastqc.zip \\
-      --organism human \\
-      --experiment-type rnaseq \\
-      --output-dir batch_results/ \\
-      --parallel 4
-
-Method 3: Using wildcards (shell expansion)
-  # Process all FastQC files in directory
-  $ phredator batch results/qc/*_fastqc.zip \\
-      --organism human \\
-      --experiment-type rnaseq \\
-      --output-dir batch_results/ \\
-      --parallel 4
-
-  Output:
-    Processed 96 samples:
-    [PASS] 78 (81%)
-    [WARN] 12 (13%)
-    [FAIL] 6 (6%)
-
-    Average metrics:
-    - GC content: 41.2% ± 2.3%
-    - Quality: Q38.5 ± 1.2
-    - Duplication: 65.3% ± 18.9% (normal for RNA-seq)
-
-    Outliers:
-    - Sample_23: GC content = 35.0% (possible contamination)
-    - Sample_67: Quality = Q22.0 (resequence recommended)
-
-
-FUZZY MATCHING
---------------
-Phredator accepts natural input for organism and experiment types:
-
-  "Human" → human
-  "chip-seq" → chipseq
-  "RNA seq" → rnaseq
-
-See all available profiles:
-  $ phredator list-organisms
-  $ phredator list-organisms --detailed
-
-
-REAL-WORLD EXAMPLE
-------------------
-You have 16 ChIP-seq samples in ~/MEF2C_ChIPseq/results/qc/:
-
-Method 1: Quick batch with wildcards
-  $ phredator batch ~/MEF2C_ChIPseq/results/qc/*_fastqc.zip \\
-      --organism human \\
-      --experiment-type chipseq \\
-      --output-dir chipseq_qc/ \\
-      --parallel 4
-
-Method 2: Using a list file
-  $ ls ~/MEF2C_ChIPseq/results/qc/*_fastqc.zip > chipseq_samples.txt
-  $ phredator batch chipseq_samples.txt \\
-      --organism human \\
-      --experiment-type chipseq \\
-      --output-dir chipseq_qc/ \\
-      --parallel 4
-
-Method 3: Individual sample inspection
-  $ phredator parse ~/MEF2C_ChIPseq/results/qc/SRR35220282_1_fastqc.zip \\
-      --output sample.json
-  $ phredator analyze sample.json \\
-      --organism human \\
-      --experiment-type chipseq \\
-      --output analysis.json
-
-//================================================================\\\\
-||  Need more help? Use --help with any command for details      ||
-\\\\================================================================//
-""")
+            from phredator.cli._examples import EXAMPLES_TEXT
+            print(EXAMPLES_TEXT)
         
         elif args.command == "list-organisms":
+            from phredator.utils.profile_loader import ProfileLoader
             profile_loader = ProfileLoader()
             organisms = profile_loader.list_organisms()
             
@@ -248,8 +418,12 @@ Method 3: Individual sample inspection
             print("="*70)
             
             if args.detailed:
-                for org in organisms:
-                    profile = profile_loader.load_organism_profile(org)
+                # Profile files are independent; read them concurrently, print in order
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    profiles = list(executor.map(profile_loader.load_organism_profile, organisms))
+                
+                for org, profile in zip(organisms, profiles):
                     if profile:
                         gc_mean = profile.gc_content.get('mean', 'N/A')
                         gc_range = profile.gc_content.get('range', ['N/A', 'N/A'])
@@ -273,22 +447,23 @@ Method 3: Individual sample inspection
                 print(f"[INFO] Parsing data from: {args.input_path}")
             
             # Auto-detect MultiQC vs FastQC
-            if args.input_path.endswith('.json') or 'multiqc_data.json' in args.input_path:
+            if Path(args.input_path).suffix.lower() == '.json':
                 # MultiQC JSON file
                 from phredator.parser.multiqc_parser import MultiQCParser
                 parser_obj = MultiQCParser(args.input_path)
                 multiqc_data = parser_obj.parse()
-                with open(args.output, "w") as f:
-                    json.dump(multiqc_data, f, indent=2)
+                from phredator.utils.helpers import dump_json
+                dump_json(multiqc_data, args.output)
                 if args.verbose:
                     print(f"[INFO] MultiQC parsing complete. {multiqc_data['total_samples']} samples found")
                     print(f"[INFO] Output saved to {args.output}")
             else:
                 # FastQC file/zip
+                from phredator.parser.fastqc_parser import FastQCParser
                 parser_obj = FastQCParser(args.input_path)
                 report = parser_obj.parse()
-                with open(args.output, "w") as f:
-                    f.write(report.to_json())
+                from phredator.utils.helpers import dump_json
+                dump_json(report.to_dict(), args.output, indent=4)
                 if args.verbose:
                     print(f"[INFO] FastQC parsing complete. Output saved to {args.output}")
 
@@ -300,6 +475,8 @@ Method 3: Individual sample inspection
                 if args.experiment_type:
                     print(f"[INFO] Using experiment type: {args.experiment_type}")
             
+            from phredator.analyzer.qc_analyzer import Analyzer
+            
             # Determine expected_gc
             expected_gc = args.expected_gc if args.expected_gc is not None else 50.0
             
@@ -312,38 +489,25 @@ Method 3: Individual sample inspection
             analysis = analyzer.run()
             
             # Save JSON output
-            with open(args.output, "w") as f:
-                f.write(analysis.to_json())
+            from phredator.utils.helpers import dump_json
+            dump_json(analysis.to_dict(), args.output, indent=4)
             
-            # ANSI color codes
-            RED = '\033[31m'  # Dark red instead of bright red
-            BOLD = '\033[1m'
-            RESET = '\033[0m'
+            # The log sits next to the JSON output; with_suffix() also handles
+            # outputs without a .json extension, which replace() would clobber
+            log_file = Path(args.output).with_suffix('.log')
             
             # Generate and display terminal summary (Subread-style)
             summary_lines = []
+            summary_lines.append(_PHREDATOR_BANNER)
             summary_lines.append("")
-            summary_lines.append(f"{RED}{BOLD}")
-            summary_lines.append("  ██████╗ ██╗  ██╗██████╗ ███████╗██████╗  ██████╗ ████████╗ ██████╗ ██████╗ ")
-            summary_lines.append("  ██╔══██╗██║  ██║██╔══██╗██╔════╝██╔══██╗██╔═══██╗╚══██╔══╝██╔═══██╗██╔══██╗")
-            summary_lines.append("  ██████╔╝███████║██████╔╝█████╗  ██║  ██║███████║   ██║   ██║   ██║██████╔╝")
-            summary_lines.append("  ██╔═══╝ ██╔══██║██╔══██╗██╔══╝  ██║  ██║██╔══██║   ██║   ██║   ██║██╔══██╗")
-            summary_lines.append("  ██║     ██║  ██║██║  ██║███████╗██████╔╝██║  ██║   ██║   ╚██████╔╝██║  ██║")
-            summary_lines.append("  ╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝╚═════╝ ╚═╝  ╚═╝   ╚═╝    ╚═════╝ ╚═╝  ╚═╝")
-            summary_lines.append(f"{RESET}")
-            summary_lines.append("")
-            summary_lines.append("//================================\\\\")
-            summary_lines.append("||       QC Analysis Report       ||")
-            summary_lines.append("\\\\================================//")
+            summary_lines.append(_HDR_QC)
             summary_lines.append("")
             summary_lines.append(f"         Sample : {analysis.sample_name}")
             summary_lines.append(f"         Status : {analysis.overall_status.upper()}")
             if analysis.profile_info:
                 summary_lines.append(f"        Profile : {analysis.profile_info}")
             summary_lines.append("")
-            summary_lines.append("//================================\\\\")
-            summary_lines.append("||    Quality Assessments         ||")
-            summary_lines.append("\\\\================================//")
+            summary_lines.append(_HDR_ASSESSMENTS)
             summary_lines.append("")
             
             for module, result in analysis.metrics.items():
@@ -353,30 +517,28 @@ Method 3: Individual sample inspection
             
             if hasattr(analysis, 'all_recommendations') and analysis.all_recommendations:
                 summary_lines.append("")
-                summary_lines.append("//================================\\\\")
-                summary_lines.append("||       Recommendations          ||")
-                summary_lines.append("\\\\================================//")
+                summary_lines.append(_HDR_RECS)
                 summary_lines.append("")
-                for i, rec in enumerate(analysis.all_recommendations[:8], 1):
+                for i, rec in enumerate(islice(analysis.all_recommendations, 8), 1):
                     summary_lines.append(f"   {i}. {rec}")
                 if len(analysis.all_recommendations) > 8:
                     summary_lines.append(f"   ... ({len(analysis.all_recommendations) - 8} more recommendations)")
             
             summary_lines.append("")
-            summary_lines.append("//================================\\\\")
+            summary_lines.append(_BOX_TOP)
             summary_lines.append(f"   Output saved to : {args.output}")
-            summary_lines.append(f"   Log saved to    : {args.output.replace('.json', '.log')}")
-            summary_lines.append("\\\\================================//")
+            summary_lines.append(f"   Log saved to    : {log_file}")
+            summary_lines.append(_BOX_BOTTOM)
             summary_lines.append("")
             
             # Display in terminal
             summary_text = "\n".join(summary_lines)
-            print(summary_text)
+            sys.stdout.write(summary_text)
+            sys.stdout.write("\n")
+            sys.stdout.flush()
             
             # Save to log file
-            log_file = args.output.replace('.json', '.log')
-            with open(log_file, "w") as f:
-                f.write(summary_text)
+            log_file.write_text(summary_text)
 
         elif args.command == "fix":
             if args.verbose:
@@ -384,35 +546,36 @@ Method 3: Individual sample inspection
             
             # Show tool status if requested
             if args.show_tool_status:
-                from phredator.utils.tool_checker import ToolChecker
-                checker = ToolChecker()
+                from phredator.utils.tool_checker import shared_tool_checker
+                checker = shared_tool_checker()
                 print("\n" + "="*60)
                 print("Tool Availability Status".center(60))
                 print("="*60)
                 checker.print_tool_status(verbose=True)
                 print("="*60 + "\n")
             
+            from phredator.fixer.qc_fixer import Fixer
             fixer = Fixer(args.input_path, input_reads=args.input_reads, check_tools=args.check_tools)
             fixes = fixer.run()
             
             # Save JSON output
-            with open(args.output, "w") as f:
-                f.write(fixes.to_json())
+            from phredator.utils.helpers import dump_json
+            dump_json(fixes.to_dict(), args.output, indent=4)
+            
+            # The log sits next to the JSON output; with_suffix() also handles
+            # outputs without a .json extension, which replace() would clobber
+            log_file = Path(args.output).with_suffix('.log')
             
             # Generate and display terminal summary (Subread-style)
             summary_lines = []
             summary_lines.append("")
-            summary_lines.append("//================================\\\\")
-            summary_lines.append("||     Fix Suggestions Report     ||")
-            summary_lines.append("\\\\================================//")
+            summary_lines.append(_HDR_FIXES)
             summary_lines.append("")
             summary_lines.append(f"   Total fixes suggested : {len(fixes.fixes_applied)}")
             summary_lines.append("")
             
             if fixes.fixes_applied:
-                summary_lines.append("//================================\\\\")
-                summary_lines.append("||    Recommended Actions         ||")
-                summary_lines.append("\\\\================================//")
+                summary_lines.append(_HDR_ACTIONS)
                 summary_lines.append("")
                 for i, fix in enumerate(fixes.fixes_applied, 1):
                     priority_tag = f"[{fix['priority'].upper():6s}]"
@@ -431,45 +594,44 @@ Method 3: Individual sample inspection
                 summary_lines.append("")
             
             if hasattr(fixes, 'suggested_pipeline') and fixes.suggested_pipeline:
-                summary_lines.append("//================================\\\\")
-                summary_lines.append("||      Suggested Pipeline        ||")
-                summary_lines.append("\\\\================================//")
+                summary_lines.append(_HDR_PIPELINE)
                 summary_lines.append("")
-                for line in fixes.suggested_pipeline[:15]:
+                for line in islice(fixes.suggested_pipeline, 15):
                     summary_lines.append(f"   {line}")
                 if len(fixes.suggested_pipeline) > 15:
                     summary_lines.append(f"   ... ({len(fixes.suggested_pipeline) - 15} more lines)")
                 summary_lines.append("")
             
-            summary_lines.append("//================================\\\\")
+            summary_lines.append(_BOX_TOP)
             summary_lines.append(f"   Output saved to : {args.output}")
-            summary_lines.append(f"   Log saved to    : {args.output.replace('.json', '.log')}")
-            summary_lines.append("\\\\================================//")
+            summary_lines.append(f"   Log saved to    : {log_file}")
+            summary_lines.append(_BOX_BOTTOM)
             summary_lines.append("")
             
             # Display in terminal
             summary_text = "\n".join(summary_lines)
-            print(summary_text)
+            sys.stdout.write(summary_text)
+            sys.stdout.write("\n")
+            sys.stdout.flush()
             
             # Save to log file
-            log_file = args.output.replace('.json', '.log')
-            with open(log_file, "w") as f:
-                f.write(summary_text)
-
-                if args.check_tools and fixes.tool_availability:
-                    ta = fixes.tool_availability
-                    print(f"[INFO] Tools available: {ta['total_installed']}/{ta['total_installed'] + ta['total_missing']}")
-                    if ta['missing']:
-                        print(f"[WARN] Missing tools: {', '.join(ta['missing'])}")
-                
-                if fixes.read_length:
-                    print(f"[INFO] Detected read length: {fixes.read_length}bp")
-                if fixes.is_paired_end:
-                    print(f"[INFO] Detected paired-end reads")
+            log_file.write_text(summary_text)
+            
+            if args.check_tools and fixes.tool_availability:
+                ta = fixes.tool_availability
+                print(f"[INFO] Tools available: {ta['total_installed']}/{ta['total_installed'] + ta['total_missing']}")
+                if ta['missing']:
+                    print(f"[WARN] Missing tools: {', '.join(ta['missing'])}")
+            
+            if fixes.read_length:
+                print(f"[INFO] Detected read length: {fixes.read_length}bp")
+            if fixes.is_paired_end:
+                print(f"[INFO] Detected paired-end reads")
 
         elif args.command == "report":
             if args.verbose:
                 print(f"[INFO] Generating report from: {args.input_path}")
+            from phredator.reporter.report_generator import Reporter
             reporter = Reporter(args.input_path)
             reporter.generate(args.output, fmt=args.format)
             if args.verbose:
@@ -490,9 +652,8 @@ Method 3: Individual sample inspection
                 
                 # Check if it's a text file (list) or a FastQC file
                 if sample_path.suffix in ['.txt', '.list']:
-                    # Read from list file (one sample per line)
-                    with open(sample_path, 'r') as f:
-                        sample_list = [line.strip() for line in f if line.strip() and not line.startswith('#')]
+                    # Stream from list file (one sample per line)
+                    sample_list = _iter_sample_list(sample_path)
                 else:
                     # It's a single FastQC file
                     sample_list = [str(sample_path)]
@@ -501,9 +662,12 @@ Method 3: Individual sample inspection
                 sample_list = args.samples
             
             if args.verbose:
+                # Progress output needs the sample count up front
+                sample_list = list(sample_list)
                 print(f"[INFO] Loaded {len(sample_list)} samples")
             
             # Initialize batch processor
+            from phredator.parser.batch_processor import BatchProcessor
             batch_processor = BatchProcessor(
                 sample_list=sample_list,
                 output_dir=args.output_dir,
@@ -511,6 +675,7 @@ Method 3: Individual sample inspection
                 experiment_type=args.experiment_type,
                 check_tools=args.check_tools,
                 parallel=args.parallel,
+                chunk_size=args.batch_chunk_size,
                 dry_run=args.dry_run,
                 verbose=args.verbose
             )
@@ -518,203 +683,16 @@ Method 3: Individual sample inspection
             # Process all samples
             report = batch_processor.process_all()
             
-            # ANSI color codes
-            RED = '\033[31m'  # Dark red instead of bright red
-            BOLD = '\033[1m'
-            RESET = '\033[0m'
-            
-            # Generate professional terminal summary with red Phredator title
-            summary_lines = []
-            summary_lines.append("")
-            summary_lines.append(f"{RED}{BOLD}")
-            summary_lines.append("  ██████╗ ██╗  ██╗██████╗ ███████╗██████╗  ██████╗ ████████╗ ██████╗ ██████╗ ")
-            summary_lines.append("  ██╔══██╗██║  ██║██╔══██╗██╔════╝██╔══██╗██╔═══██╗╚══██╔══╝██╔═══██╗██╔══██╗")
-            summary_lines.append("  ██████╔╝███████║██████╔╝█████╗  ██║  ██║███████║   ██║   ██║   ██║██████╔╝")
-            summary_lines.append("  ██╔═══╝ ██╔══██║██╔══██╗██╔══╝  ██║  ██║██╔══██║   ██║   ██║   ██║██╔══██╗")
-            summary_lines.append("  ██║     ██║  ██║██║  ██║███████╗██████╔╝██║  ██║   ██║   ╚██████╔╝██║  ██║")
-            summary_lines.append("  ╚═╝     ╚═╝  ╚═╝╚═╝  ╚═╝╚══════╝╚═════╝ ╚═╝  ╚═╝   ╚═╝    ╚═════╝ ╚═╝  ╚═╝")
-            summary_lines.append(f"{RESET}")
-            summary_lines.append("")
-            summary_lines.append("//================================\\\\")
-            summary_lines.append("||   Batch Processing Summary     ||")
-            summary_lines.append("\\\\================================//")
-            summary_lines.append("")
-            summary_lines.append(f"   Processed {report.successful}/{report.total_samples} samples:")
-            
-            if report.statistics:
-                stats = report.statistics
-                total_processed = stats.pass_count + stats.warn_count + stats.fail_count
-                
-                if total_processed > 0:
-                    pass_pct = (stats.pass_count / total_processed) * 100
-                    warn_pct = (stats.warn_count / total_processed) * 100
-                    fail_pct = (stats.fail_count / total_processed) * 100
-                    
-                    summary_lines.append(f"   [PASS] {stats.pass_count} ({pass_pct:.0f}%)")
-                    summary_lines.append(f"   [WARN] {stats.warn_count} ({warn_pct:.0f}%)")
-                    summary_lines.append(f"   [FAIL] {stats.fail_count} ({fail_pct:.0f}%)")
-            
-            if report.failed > 0:
-                summary_lines.append(f"   Failed  : {report.failed} samples")
-            if report.skipped > 0:
-                summary_lines.append(f"   Skipped : {report.skipped} samples")
-            
-            # Show per-sample details
-            summary_lines.append("")
-            summary_lines.append("//================================\\\\")
-            summary_lines.append("||      Sample Details            ||")
-            summary_lines.append("\\\\================================//")
-            summary_lines.append("")
-            
-            for sample_result in report.sample_results[:20]:  # Show first 20 samples
-                if sample_result.status == "success" and sample_result.analysis_json:
-                    try:
-                        with open(sample_result.analysis_json, 'r') as f:
-                            analysis_data = json.load(f)
-                        
-                        status_symbol = "[PASS]" if sample_result.overall_status.upper() == "PASS" else "[WARN]" if sample_result.overall_status.upper() == "WARN" else "[FAIL]"
-                        summary_lines.append(f"   {status_symbol} {sample_result.sample_name}")
-                        summary_lines.append("")
-                        
-                        # Show ALL metrics with status symbols
-                        if 'metrics' in analysis_data:
-                            metrics = analysis_data['metrics']
-                            
-                            # Define metric display order
-                            metric_order = [
-                                'per_base_quality',
-                                'gc_content', 
-                                'duplication_levels',
-                                'adapter_content',
-                                'overrepresented_sequences',
-                                'per_base_n_content',
-                                'sequence_length_distribution',
-                                'per_sequence_quality',
-                                'per_tile_quality',
-                                'per_sequence_gc_content',
-                                'kmer_content'
-                            ]
-                            
-                            for metric_key in metric_order:
-                                if metric_key in metrics:
-                                    metric = metrics[metric_key]
-                                    status = metric.get('status', '').upper()
-                                    summary = metric.get('summary', '')
-                                    
-                                    # Status symbol
-                                    if status == 'PASS':
-                                        symbol = "[PASS]"
-                                    elif status == 'WARN':
-                                        symbol = "[WARN]"
-                                    elif status == 'FAIL':
-                                        symbol = "[FAIL]"
-                                    else:
-                                        symbol = "[INFO]"
-                                    
-                                    # Format metric name nicely
-                                    metric_name = metric_key.replace('_', ' ').title()
-                                    
-                                    summary_lines.append(f"      {symbol} {metric_name:30s} : {summary}")
-                        
-                        summary_lines.append("")
-                    except:
-                        pass
-            
-            if len(report.sample_results) > 20:
-                summary_lines.append(f"   ... and {len(report.sample_results) - 20} more samples")
-                summary_lines.append("")
-            
-            summary_lines.append("")
-            summary_lines.append("//================================\\\\")
-            summary_lines.append("||      Average Metrics           ||")
-            summary_lines.append("\\\\================================//")
-            summary_lines.append("")
-            
-            if report.statistics:
-                stats = report.statistics
-                
-                if stats.gc_mean is not None:
-                    gc_display = f"{stats.gc_mean:.1f}%"
-                    if stats.gc_std is not None:
-                        gc_display += f" ± {stats.gc_std:.1f}%"
-                    summary_lines.append(f"   GC content   : {gc_display}")
-                
-                if stats.quality_mean is not None:
-                    q_display = f"Q{stats.quality_mean:.1f}"
-                    if stats.quality_std is not None:
-                        q_display += f" ± {stats.quality_std:.1f}"
-                    summary_lines.append(f"   Quality      : {q_display}")
-                
-                if stats.duplication_mean is not None:
-                    dup_display = f"{stats.duplication_mean:.1f}%"
-                    if stats.duplication_std is not None:
-                        dup_display += f" ± {stats.duplication_std:.1f}%"
-                    
-                    # Add context for duplication based on experiment type
-                    context = ""
-                    if args.experiment_type and 'rna' in args.experiment_type.lower():
-                        context = " (normal for RNA-seq)"
-                    elif args.experiment_type and 'chip' in args.experiment_type.lower():
-                        context = " (expected for ChIP-seq)"
-                    
-                    summary_lines.append(f"   Duplication  : {dup_display}{context}")
-                
-                # Show outliers if any
-                if stats.outliers:
-                    summary_lines.append("")
-                    summary_lines.append("//================================\\\\")
-                    summary_lines.append("||         Outliers               ||")
-                    summary_lines.append("\\\\================================//")
-                    summary_lines.append("")
-                    
-                    for outlier in stats.outliers[:10]:
-                        summary_lines.append(f"   {outlier['sample']:20s} : {outlier['metric']} = {outlier['value']} ({outlier['reason']})")
-                    
-                    if len(stats.outliers) > 10:
-                        summary_lines.append(f"   ... and {len(stats.outliers) - 10} more outliers")
-            
-            # Collect all recommendations from all samples
-            all_recommendations = set()
-            for sample_result in report.sample_results:
-                if sample_result.analysis_json and sample_result.status == "success":
-                    try:
-                        with open(sample_result.analysis_json, 'r') as f:
-                            analysis_data = json.load(f)
-                            if 'all_recommendations' in analysis_data:
-                                for rec in analysis_data['all_recommendations']:
-                                    all_recommendations.add(rec)
-                    except:
-                        pass
-            
-            # Show common recommendations
-            if all_recommendations:
-                summary_lines.append("")
-                summary_lines.append("//================================\\\\")
-                summary_lines.append("||      Recommendations           ||")
-                summary_lines.append("\\\\================================//")
-                summary_lines.append("")
-                
-                for i, rec in enumerate(sorted(all_recommendations)[:10], 1):
-                    summary_lines.append(f"   {i}. {rec}")
-                
-                if len(all_recommendations) > 10:
-                    summary_lines.append(f"   ... and {len(all_recommendations) - 10} more recommendations")
-            
-            summary_lines.append("")
-            summary_lines.append("//================================\\\\")
-            summary_lines.append(f"   Output : {args.output_dir}")
-            summary_lines.append(f"   Report : {args.output_dir}/batch_report.json")
-            summary_lines.append("\\\\================================//")
-            summary_lines.append("")
-            
-            # Display in terminal
-            summary_text = "\n".join(summary_lines)
-            print(summary_text)
-            
-            # Save to log file
-            log_file = Path(args.output_dir) / "batch_summary.log"
-            with open(log_file, "w") as f:
-                f.write(summary_text)
+            # Stream the summary to the terminal and the log as it is produced
+            out_dir = batch_processor.output_dir
+            with open(out_dir / "batch_summary.log", "w") as log:
+                separator = ""
+                for line in _iter_batch_summary_lines(report, args, out_dir):
+                    sys.stdout.write(separator + line)
+                    log.write(separator + line)
+                    separator = "\n"
+            sys.stdout.write("\n")
+            sys.stdout.flush()
 
 
         elif args.command == "pipeline":
@@ -723,6 +701,7 @@ Method 3: Individual sample inspection
                 if args.dry_run:
                     print(f"[INFO] DRY-RUN MODE - No fixes will be executed")
             
+            from phredator.pipeline.pipeline_runner import PipelineRunner
             runner = PipelineRunner(
                 input_fastq=args.input_fastq,
                 output_dir=args.output_dir,
@@ -774,6 +753,7 @@ Method 3: Individual sample inspection
             if args.verbose:
                 print(f"[INFO] Batch parsing {len(args.input_paths)} samples")
             
+            from phredator.parser.batch_parser import BatchParser
             batch = BatchParser(args.input_paths)
             batch.parse_all()
             batch.save_batch_report(args.output)
@@ -1,12 +1,28 @@
 
 
 import json
-import os
 import re
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 
-from phredator.utils.tool_checker import ToolChecker
+from phredator.utils.helpers import load_json
+from phredator.utils.tool_checker import shared_tool_checker
+
+# Read-pair markers in FASTQ names: _R1_, .2., _forward, .reverse, ...
+_PAIRED_END_RE = re.compile(r'[_\.]R?[12][_\.]|[_\.]forward|[_\.]reverse', re.I)
+
+# Metric statuses that call for a fix
+_FIX_STATUSES = frozenset(("warn", "fail"))
+
+# Pipeline ordering of suggested fixes: by priority, then by category
+_PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+_CATEGORY_ORDER = {
+    "quality_trimming": 0,
+    "adapter_removal": 1,
+    "contamination_screening": 2,
+    "contamination_removal": 3,
+    "duplicate_removal": 4
+}
 
 
 @dataclass
@@ -18,6 +34,17 @@ class FixSuggestion:
     command: str  # Actual command to run
     reason: str
     tool_required: Optional[str] = None  # Tool key required to run this fix
+    
+    def to_dict(self) -> Dict[str, Any]:
+        # Built by hand: asdict() reflects over fields for every suggestion
+        return {
+            "category": self.category,
+            "priority": self.priority,
+            "description": self.description,
+            "command": self.command,
+            "reason": self.reason,
+            "tool_required": self.tool_required,
+        }
 
 
 @dataclass
@@ -33,11 +60,19 @@ class QCFixResult:
     
     def to_json(self) -> str:
 
-        return json.dumps(asdict(self), indent=4)
+        return json.dumps(self.to_dict(), indent=4)
     
     def to_dict(self) -> Dict[str, Any]:
-
-        return asdict(self)
+        # Built by hand: asdict() reflects over fields and deep-copies containers
+        return {
+            "sample_name": self.sample_name,
+            "input_file": self.input_file,
+            "fixes_applied": self.fixes_applied,
+            "suggested_pipeline": self.suggested_pipeline,
+            "tool_availability": self.tool_availability,
+            "read_length": self.read_length,
+            "is_paired_end": self.is_paired_end,
+        }
 
 
 class Fixer:
@@ -45,22 +80,23 @@ class Fixer:
     def __init__(self, input_path: str, input_reads: str = None, check_tools: bool = False):
         self.input_path = input_path
         self.input_reads = input_reads or "INPUT_READS.fastq.gz"
+        # Mate file name used by every paired-end command
+        self._r2_file = self.input_reads.replace("_R1", "_R2").replace("_1.", "_2.")
         self.analysis_data = None
         self.sample_name = "Unknown"
         self.fixes = []
         self.check_tools = check_tools
-        self.tool_checker = ToolChecker() if check_tools else None
+        self.tool_checker = shared_tool_checker() if check_tools else None
         
         self.read_length = None
         self.is_paired_end = False
         self.quality_threshold = 20
         
     def load_analysis(self) -> Dict[str, Any]:
-        if not os.path.exists(self.input_path):
-            raise FileNotFoundError(f"Analysis file not found: {self.input_path}")
-        
-        with open(self.input_path, 'r') as f:
-            self.analysis_data = json.load(f)
+        try:
+            self.analysis_data = load_json(self.input_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Analysis file not found: {self.input_path}") from None
         
         if 'sample_name' in self.analysis_data:
             self.sample_name = self.analysis_data['sample_name']
@@ -99,7 +135,7 @@ class Fixer:
         
         filename = stats_dict.get('Filename', self.input_reads)
         if filename:
-            self.is_paired_end = bool(re.search(r'[_\.]R?[12][_\.]|[_\.]forward|[_\.]reverse', filename, re.I))
+            self.is_paired_end = bool(_PAIRED_END_RE.search(filename))
         
         profile_info = data.get('profile_info', '')
         if 'COVID' in profile_info or 'SARS-CoV-2' in profile_info:
@@ -122,29 +158,21 @@ class Fixer:
             return int(read_len * 0.4)
     
     def _sort_and_select_fixes(self, all_fixes):
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        category_order = {
-            "quality_trimming": 0,
-            "adapter_removal": 1,
-            "contamination_screening": 2,
-            "contamination_removal": 3,
-            "duplicate_removal": 4
-        }
+        # One pass keeps the best fix per category (lowest priority rank, then
+        # earliest); only those few winners need ordering
+        best = {}
+        for index, fix in enumerate(all_fixes):
+            rank = (_PRIORITY_ORDER.get(fix.priority, 3), _CATEGORY_ORDER.get(fix.category, 5), index)
+            current = best.get(fix.category)
+            if current is None or rank < current[0]:
+                best[fix.category] = (rank, fix)
         
-        sorted_fixes = sorted(
-            all_fixes,
-            key=lambda x: (priority_order.get(x.priority, 3), category_order.get(x.category, 5))
-        )
-        
-        seen_categories = set()
         pipeline = []
         
-        for fix in sorted_fixes:
-            if fix.category not in seen_categories:
-                pipeline.append(f"# {fix.description}")
-                pipeline.append(fix.command)
-                pipeline.append("")  # Blank line for readability
-                seen_categories.add(fix.category)
+        for _, fix in sorted(best.values(), key=lambda ranked: ranked[0]):
+            pipeline.append(f"# {fix.description}")
+            pipeline.append(fix.command)
+            pipeline.append("")  # Blank line for readability
         
         # Add final QC check
         pipeline.append("# Re-run FastQC to verify improvements")
@@ -152,124 +180,122 @@ class Fixer:
         
         return pipeline
     
+    def _available_tools(self, category: str, defaults: List[str]) -> List[str]:
+        # Installed alternatives when tool checking is on, else every tool we know commands for
+        if self.check_tools and self.tool_checker:
+            available_tools = self.tool_checker.suggest_alternatives(category)
+            if available_tools:
+                return available_tools
+        return defaults
+    
     def generate_quality_trim_fixes(self, metrics: Dict) -> List[FixSuggestion]:
         fixes = []
-        quality_metric = metrics.get("per_base_quality", {})
+        # Settings read by every command template below, bound once
+        sample_name = self.sample_name
+        is_paired_end = self.is_paired_end
+        minlen = self._calculate_minlen()
+        quality_threshold = self.quality_threshold if self.quality_threshold else 20
+        input_file = self.input_reads if self.input_reads else "INPUT_READS.fastq.gz"
         
-        if quality_metric.get("status") in ["warn", "fail"]:
-            minlen = self._calculate_minlen()
-            quality_threshold = self.quality_threshold if self.quality_threshold else 20
-            input_file = self.input_reads if self.input_reads else "INPUT_READS.fastq.gz"
-            
-            if self.check_tools and self.tool_checker:
-                available_tools = self.tool_checker.suggest_alternatives("quality_trim")
-                if not available_tools or not isinstance(available_tools, list) or len(available_tools) == 0:
-                    available_tools = ["fastp", "trimmomatic", "cutadapt"]
+        available_tools = self._available_tools("quality_trim", ["fastp", "trimmomatic", "cutadapt"])
+        
+        if "fastp" in available_tools:
+            if is_paired_end:
+                r1_file = input_file
+                r2_file = self._r2_file
+                cmd = f"fastp -i {r1_file} -I {r2_file} -o {sample_name}_R1_trimmed.fastq.gz -O {sample_name}_R2_trimmed.fastq.gz -q {quality_threshold} -l {minlen}"
             else:
-                available_tools = ["fastp", "trimmomatic", "cutadapt"]
+                cmd = f"fastp -i {input_file} -o {sample_name}_trimmed.fastq.gz -q {quality_threshold} -l {minlen}"
             
-            if "fastp" in available_tools:
-                if self.is_paired_end:
-                    r1_file = input_file
-                    r2_file = input_file.replace("_R1", "_R2").replace("_1.", "_2.")
-                    cmd = f"fastp -i {r1_file} -I {r2_file} -o {self.sample_name}_R1_trimmed.fastq.gz -O {self.sample_name}_R2_trimmed.fastq.gz -q {quality_threshold} -l {minlen}"
-                else:
-                    cmd = f"fastp -i {input_file} -o {self.sample_name}_trimmed.fastq.gz -q {quality_threshold} -l {minlen}"
-                
-                fixes.append(FixSuggestion(
-                    category="quality_trimming",
-                    priority="high",
-                    description="Quality trim using fastp",
-                    command=cmd,
-                    reason=f"Low quality bases detected (threshold Q{quality_threshold})",
-                    tool_required="fastp"
-                ))
+            fixes.append(FixSuggestion(
+                category="quality_trimming",
+                priority="high",
+                description="Quality trim using fastp",
+                command=cmd,
+                reason=f"Low quality bases detected (threshold Q{quality_threshold})",
+                tool_required="fastp"
+            ))
+        
+        if "trimmomatic" in available_tools:
+            if is_paired_end:
+                r1_file = input_file
+                r2_file = self._r2_file
+                cmd = f"trimmomatic PE -phred33 {r1_file} {r2_file} {sample_name}_R1_paired.fastq.gz {sample_name}_R1_unpaired.fastq.gz {sample_name}_R2_paired.fastq.gz {sample_name}_R2_unpaired.fastq.gz LEADING:{quality_threshold} TRAILING:{quality_threshold} SLIDINGWINDOW:4:{quality_threshold} MINLEN:{minlen}"
+            else:
+                cmd = f"trimmomatic SE -phred33 {input_file} {sample_name}_trimmed.fastq.gz LEADING:{quality_threshold} TRAILING:{quality_threshold} SLIDINGWINDOW:4:{quality_threshold} MINLEN:{minlen}"
             
-            if "trimmomatic" in available_tools:
-                if self.is_paired_end:
-                    r1_file = input_file
-                    r2_file = input_file.replace("_R1", "_R2").replace("_1.", "_2.")
-                    cmd = f"trimmomatic PE -phred33 {r1_file} {r2_file} {self.sample_name}_R1_paired.fastq.gz {self.sample_name}_R1_unpaired.fastq.gz {self.sample_name}_R2_paired.fastq.gz {self.sample_name}_R2_unpaired.fastq.gz LEADING:{quality_threshold} TRAILING:{quality_threshold} SLIDINGWINDOW:4:{quality_threshold} MINLEN:{minlen}"
-                else:
-                    cmd = f"trimmomatic SE -phred33 {input_file} {self.sample_name}_trimmed.fastq.gz LEADING:{quality_threshold} TRAILING:{quality_threshold} SLIDINGWINDOW:4:{quality_threshold} MINLEN:{minlen}"
-                
-                fixes.append(FixSuggestion(
-                    category="quality_trimming",
-                    priority="high",
-                    description="Quality trim using Trimmomatic",
-                    command=cmd,
-                    reason=f"Low quality bases detected (threshold Q{quality_threshold})",
-                    tool_required="trimmomatic"
-                ))
+            fixes.append(FixSuggestion(
+                category="quality_trimming",
+                priority="high",
+                description="Quality trim using Trimmomatic",
+                command=cmd,
+                reason=f"Low quality bases detected (threshold Q{quality_threshold})",
+                tool_required="trimmomatic"
+            ))
         
         return fixes
     
     def generate_adapter_trim_fixes(self, metrics: Dict) -> List[FixSuggestion]:
         fixes = []
-        adapter_metric = metrics.get("adapter_content", {})
+        # Settings read by every command template below, bound once
+        sample_name = self.sample_name
+        is_paired_end = self.is_paired_end
+        minlen = self._calculate_minlen()
+        quality_threshold = self.quality_threshold if self.quality_threshold else 20
+        input_file = self.input_reads if self.input_reads else "INPUT_READS.fastq.gz"
         
-        if adapter_metric.get("status") in ["warn", "fail"]:
-            minlen = self._calculate_minlen()
-            quality_threshold = self.quality_threshold if self.quality_threshold else 20
-            input_file = self.input_reads if self.input_reads else "INPUT_READS.fastq.gz"
-            
-            if self.check_tools and self.tool_checker:
-                available_tools = self.tool_checker.suggest_alternatives("adapter_removal")
-                if not available_tools or not isinstance(available_tools, list) or len(available_tools) == 0:
-                    available_tools = ["cutadapt", "fastp", "trimmomatic"]
+        available_tools = self._available_tools("adapter_removal", ["cutadapt", "fastp", "trimmomatic"])
+        
+        if "cutadapt" in available_tools:
+            if is_paired_end:
+                r1_file = input_file
+                r2_file = self._r2_file
+                cmd = f"cutadapt -a AGATCGGAAGAG -A AGATCGGAAGAG -q {quality_threshold} --minimum-length {minlen} -o {sample_name}_R1_trimmed.fastq.gz -p {sample_name}_R2_trimmed.fastq.gz {r1_file} {r2_file}"
             else:
-                available_tools = ["cutadapt", "fastp", "trimmomatic"]
+                cmd = f"cutadapt -a AGATCGGAAGAG -q {quality_threshold} --minimum-length {minlen} -o {sample_name}_trimmed.fastq.gz {input_file}"
             
-            if "cutadapt" in available_tools:
-                if self.is_paired_end:
-                    r1_file = input_file
-                    r2_file = input_file.replace("_R1", "_R2").replace("_1.", "_2.")
-                    cmd = f"cutadapt -a AGATCGGAAGAG -A AGATCGGAAGAG -q {quality_threshold} --minimum-length {minlen} -o {self.sample_name}_R1_trimmed.fastq.gz -p {self.sample_name}_R2_trimmed.fastq.gz {r1_file} {r2_file}"
-                else:
-                    cmd = f"cutadapt -a AGATCGGAAGAG -q {quality_threshold} --minimum-length {minlen} -o {self.sample_name}_trimmed.fastq.gz {input_file}"
-                
-                fixes.append(FixSuggestion(
-                    category="adapter_removal",
-                    priority="medium",
-                    description="Remove Illumina adapters using Cutadapt",
-                    command=cmd,
-                    reason="Adapter contamination detected in reads",
-                    tool_required="cutadapt"
-                ))
+            fixes.append(FixSuggestion(
+                category="adapter_removal",
+                priority="medium",
+                description="Remove Illumina adapters using Cutadapt",
+                command=cmd,
+                reason="Adapter contamination detected in reads",
+                tool_required="cutadapt"
+            ))
+        
+        if "fastp" in available_tools:
+            if is_paired_end:
+                r1_file = input_file
+                r2_file = self._r2_file
+                cmd = f"fastp -i {r1_file} -I {r2_file} -o {sample_name}_R1_trimmed.fastq.gz -O {sample_name}_R2_trimmed.fastq.gz --detect_adapter_for_pe -q {quality_threshold} -l {minlen}"
+            else:
+                cmd = f"fastp -i {input_file} -o {sample_name}_trimmed.fastq.gz --detect_adapter_for_pe -q {quality_threshold} -l {minlen}"
             
-            if "fastp" in available_tools:
-                if self.is_paired_end:
-                    r1_file = input_file
-                    r2_file = input_file.replace("_R1", "_R2").replace("_1.", "_2.")
-                    cmd = f"fastp -i {r1_file} -I {r2_file} -o {self.sample_name}_R1_trimmed.fastq.gz -O {self.sample_name}_R2_trimmed.fastq.gz --detect_adapter_for_pe -q {quality_threshold} -l {minlen}"
-                else:
-                    cmd = f"fastp -i {input_file} -o {self.sample_name}_trimmed.fastq.gz --detect_adapter_for_pe -q {quality_threshold} -l {minlen}"
-                
-                fixes.append(FixSuggestion(
-                    category="adapter_removal",
-                    priority="medium",
-                    description="Auto-detect and remove adapters using fastp",
-                    command=cmd,
-                    reason="Adapter contamination detected in reads",
-                    tool_required="fastp"
-                ))
+            fixes.append(FixSuggestion(
+                category="adapter_removal",
+                priority="medium",
+                description="Auto-detect and remove adapters using fastp",
+                command=cmd,
+                reason="Adapter contamination detected in reads",
+                tool_required="fastp"
+            ))
+        
+        if "trimmomatic" in available_tools:
+            if is_paired_end:
+                r1_file = input_file
+                r2_file = self._r2_file
+                cmd = f"trimmomatic PE -phred33 {r1_file} {r2_file} {sample_name}_R1_paired.fastq.gz {sample_name}_R1_unpaired.fastq.gz {sample_name}_R2_paired.fastq.gz {sample_name}_R2_unpaired.fastq.gz ILLUMINACLIP:TruSeq3-PE.fa:2:30:10 MINLEN:{minlen}"
+            else:
+                cmd = f"trimmomatic SE -phred33 {input_file} {sample_name}_trimmed.fastq.gz ILLUMINACLIP:TruSeq3-SE.fa:2:30:10 MINLEN:{minlen}"
             
-            if "trimmomatic" in available_tools:
-                if self.is_paired_end:
-                    r1_file = input_file
-                    r2_file = input_file.replace("_R1", "_R2").replace("_1.", "_2.")
-                    cmd = f"trimmomatic PE -phred33 {r1_file} {r2_file} {self.sample_name}_R1_paired.fastq.gz {self.sample_name}_R1_unpaired.fastq.gz {self.sample_name}_R2_paired.fastq.gz {self.sample_name}_R2_unpaired.fastq.gz ILLUMINACLIP:TruSeq3-PE.fa:2:30:10 MINLEN:{minlen}"
-                else:
-                    cmd = f"trimmomatic SE -phred33 {input_file} {self.sample_name}_trimmed.fastq.gz ILLUMINACLIP:TruSeq3-SE.fa:2:30:10 MINLEN:{minlen}"
-                
-                fixes.append(FixSuggestion(
-                    category="adapter_removal",
-                    priority="medium",
-                    description="Remove adapters using Trimmomatic with adapter file",
-                    command=cmd,
-                    reason="Adapter contamination detected in reads",
-                    tool_required="trimmomatic"
-                ))
+            fixes.append(FixSuggestion(
+                category="adapter_removal",
+                priority="medium",
+                description="Remove adapters using Trimmomatic with adapter file",
+                command=cmd,
+                reason="Adapter contamination detected in reads",
+                tool_required="trimmomatic"
+            ))
         
         return fixes
     
@@ -277,38 +303,32 @@ class Fixer:
         fixes = []
         dup_metric = metrics.get("sequence_duplication", {})
         
-        if dup_metric.get("status") in ["warn", "fail"]:
-            profile_info = ""
-            if self.analysis_data:
-                profile_info = self.analysis_data.get("profile_info", "")
-            is_rnaseq = "rna" in profile_info.lower() or "rnaseq" in str(self.input_reads).lower()
+        profile_info = ""
+        if self.analysis_data:
+            profile_info = self.analysis_data.get("profile_info", "")
+        is_rnaseq = "rna" in profile_info.lower() or "rnaseq" in str(self.input_reads).lower()
+        
+        if is_rnaseq:
+            fixes.append(FixSuggestion(
+                category="duplicate_removal",
+                priority="low",
+                description="Note: High duplication is normal for RNA-seq",
+                command="# RNA-seq samples naturally have high duplication from highly expressed genes",
+                reason="RNA-seq duplication: Do not remove duplicates - they represent biological signal from gene expression",
+                tool_required=None
+            ))
+        else:
+            available_tools = self._available_tools("deduplication", ["picard", "samtools"])
             
-            if is_rnaseq:
+            if "picard" in available_tools:
                 fixes.append(FixSuggestion(
                     category="duplicate_removal",
-                    priority="low",
-                    description="Note: High duplication is normal for RNA-seq",
-                    command="# RNA-seq samples naturally have high duplication from highly expressed genes",
-                    reason="RNA-seq duplication: Do not remove duplicates - they represent biological signal from gene expression",
-                    tool_required=None
+                    priority="medium",
+                    description="Remove PCR duplicates using Picard",
+                    command=f"picard MarkDuplicates I=aligned.bam O={self.sample_name}_dedup.bam M=metrics.txt REMOVE_DUPLICATES=true",
+                    reason=f"High duplication level detected: {dup_metric.get('duplication_level', 'unknown')}%",
+                    tool_required="picard"
                 ))
-            else:
-                if self.check_tools and self.tool_checker:
-                    available_tools = self.tool_checker.suggest_alternatives("deduplication")
-                    if not available_tools or not isinstance(available_tools, list) or len(available_tools) == 0:
-                        available_tools = ["picard", "samtools"]
-                else:
-                    available_tools = ["picard", "samtools"]
-                
-                if "picard" in available_tools:
-                    fixes.append(FixSuggestion(
-                        category="duplicate_removal",
-                        priority="medium",
-                        description="Remove PCR duplicates using Picard",
-                        command=f"picard MarkDuplicates I=aligned.bam O={self.sample_name}_dedup.bam M=metrics.txt REMOVE_DUPLICATES=true",
-                        reason=f"High duplication level detected: {dup_metric.get('duplication_level', 'unknown')}%",
-                        tool_required="picard"
-                    ))
         
         return fixes
     
@@ -328,17 +348,22 @@ class Fixer:
         
         all_fixes = []
         
-        # Generate fixes for each category
-        all_fixes.extend(self.generate_quality_trim_fixes(metrics))
-        all_fixes.extend(self.generate_adapter_trim_fixes(metrics))
-        all_fixes.extend(self.generate_deduplication_fixes(metrics))
+        # Generate fixes only for categories whose metric needs attention,
+        # so clean samples skip fix generation entirely (this is the only
+        # status check; the generators assume their metric warns or fails)
+        for metric_key, generate in (("per_base_quality", self.generate_quality_trim_fixes),
+                                     ("adapter_content", self.generate_adapter_trim_fixes),
+                                     ("sequence_duplication", self.generate_deduplication_fixes)):
+            if metrics.get(metric_key, {}).get("status") in _FIX_STATUSES:
+                all_fixes.extend(generate(metrics))
+        # Contamination fixes are not keyed to a single metric
         all_fixes.extend(self.generate_contamination_fixes(metrics))
         
         # Generate suggested pipeline
         pipeline = self.generate_pipeline_suggestion(all_fixes)
         
         # Convert fixes to dict format
-        fixes_dict = [asdict(fix) for fix in all_fixes]
+        fixes_dict = [fix.to_dict() for fix in all_fixes]
         
         # Prepare tool availability info
         tool_availability = None
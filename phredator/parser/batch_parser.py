@@ -3,11 +3,21 @@ Batch parser for multi-sample FastQC analysis.
 """
 import os
 import json
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+
 from phredator.parser.fastqc_parser import FastQCParser, FastQCReport
 
 
+def _parse_one(path: str) -> Tuple[Optional[FastQCReport], Optional[str]]:
+    """Parse one FastQC output; module-level so worker processes can pickle it."""
+    try:
+        return FastQCParser(path).parse(), None
+    except Exception as e:
+        return None, str(e)
+
+
 class BatchParser:
     """Parse multiple FastQC outputs and generate aggregate statistics."""
     
@@ -21,16 +31,32 @@ class BatchParser:
         self.input_paths = input_paths
         self.reports: List[FastQCReport] = []
     
-    def parse_all(self) -> List[FastQCReport]:
-        """Parse all FastQC outputs."""
-        for path in self.input_paths:
-            try:
-                parser = FastQCParser(path)
-                report = parser.parse()
-                self.reports.append(report)
-            except Exception as e:
-                print(f"[WARNING] Failed to parse {path}: {e}")
+    def parse_all(self, jobs: Optional[int] = 1) -> List[FastQCReport]:
+        """
+        Parse all FastQC outputs.
+        
+        Args:
+            jobs: Worker processes to parse with (default: 1, parse serially
+                in this process; None uses one per CPU, capped at the number
+                of inputs). A process pool only pays off for larger batches.
+        """
+        if jobs is None:
+            jobs = min(os.cpu_count() or 1, len(self.input_paths))
+        
+        if jobs > 1:
+            # Hand each worker several paths per round trip on large cohorts,
+            # while keeping about four chunks per worker for load balancing
+            chunksize = max(1, len(self.input_paths) // (4 * jobs))
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                outcomes = list(executor.map(_parse_one, self.input_paths, chunksize=chunksize))
+        else:
+            outcomes = [_parse_one(path) for path in self.input_paths]
+        
+        for path, (report, error) in zip(self.input_paths, outcomes):
+            if report is None:
+                print(f"[WARNING] Failed to parse {path}: {error}")
                 continue
+            self.reports.append(report)
         
         return self.reports
     
@@ -39,36 +65,33 @@ class BatchParser:
         if not self.reports:
             return {}
         
+        # Imported here so parsing alone does not load NumPy
+        import numpy as np
+        
         # Aggregate statistics
         total_samples = len(self.reports)
         total_sequences = sum(r.total_sequences for r in self.reports)
         
         # Quality statistics
-        mean_qualities = []
-        for report in self.reports:
-            if report.per_base_quality:
-                sample_mean = sum(
-                    pos_data['mean'] 
-                    for pos_data in report.per_base_quality.values()
-                ) / len(report.per_base_quality)
-                mean_qualities.append(sample_mean)
-        
-        avg_quality_across_samples = (
-            sum(mean_qualities) / len(mean_qualities) if mean_qualities else 0
+        mean_qualities = np.fromiter(
+            (r.quality_mean for r in self.reports if r.per_base_quality),
+            dtype=np.float64
         )
+        avg_quality_across_samples = float(mean_qualities.mean()) if mean_qualities.size else 0
         
         # GC content statistics
         gc_contents = [r.gc_content_mean for r in self.reports if r.gc_content_mean > 0]
-        avg_gc = sum(gc_contents) / len(gc_contents) if gc_contents else 0
-        min_gc = min(gc_contents) if gc_contents else 0
-        max_gc = max(gc_contents) if gc_contents else 0
+        gc_array = np.asarray(gc_contents, dtype=np.float64)
+        avg_gc = float(gc_array.mean()) if gc_array.size else 0
+        min_gc = float(gc_array.min()) if gc_array.size else 0
+        max_gc = float(gc_array.max()) if gc_array.size else 0
         
         # Duplication statistics
-        duplication_rates = [
-            100 - r.total_deduplicated_percentage 
-            for r in self.reports
-        ]
-        avg_duplication = sum(duplication_rates) / len(duplication_rates)
+        duplication_rates = 100 - np.fromiter(
+            (r.total_deduplicated_percentage for r in self.reports),
+            dtype=np.float64, count=total_samples
+        )
+        avg_duplication = float(duplication_rates.mean())
         
         # Adapter contamination
         samples_with_adapters = sum(
@@ -87,7 +110,7 @@ class BatchParser:
             },
             "duplication": {
                 "mean": avg_duplication,
-                "rates": duplication_rates
+                "rates": duplication_rates.tolist()
             },
             "adapter_contamination": {
                 "samples_affected": samples_with_adapters,
@@ -97,20 +120,22 @@ class BatchParser:
         }
     
     def save_batch_report(self, output_path: str):
-        """Save batch analysis report."""
-        batch_data = {
-            "aggregate_statistics": self.get_aggregate_statistics(),
-            "individual_samples": [
-                {
+        """Save batch analysis report.
+        
+        Samples are encoded and written one per line as the file is
+        produced, so the full report never exists in memory at once.
+        """
+        with open(output_path, 'w') as f:
+            f.write('{\n"aggregate_statistics": ')
+            json.dump(self.get_aggregate_statistics(), f, indent=4)
+            f.write(',\n"individual_samples": [')
+            for i, r in enumerate(self.reports):
+                f.write(',\n    ' if i else '\n    ')
+                json.dump({
                     "sample_name": r.sample_name,
                     "total_sequences": r.total_sequences,
                     "gc_content_mean": r.gc_content_mean,
                     "duplication_pct": 100 - r.total_deduplicated_percentage,
                     "has_adapters": len(r.adapter_content) > 0
-                }
-                for r in self.reports
-            ]
-        }
-        
-        with open(output_path, 'w') as f:
-            json.dump(batch_data, f, indent=4)
+                }, f)
+            f.write('\n]\n}\n')
@@ -2,18 +2,110 @@
 
 import os
 import json
-from typing import List, Dict, Any, Optional
+import math
+import re
+from typing import List, Dict, Any, Iterable, Optional, Sized
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from itertools import count, islice
+
+import numpy as np
 
 from phredator.parser.fastqc_parser import FastQCParser
 from phredator.analyzer.qc_analyzer import Analyzer
 from phredator.fixer.qc_fixer import Fixer
+from phredator.utils.helpers import load_json, dump_json, dumps_json_line, DATACLASS_SLOTS
+from phredator.utils.profile_loader import ProfileLoader
+
+# Values embedded in analysis summaries, e.g. "Normal GC content: 49.7% (...)"
+# and "Excellent quality: mean Q=39.4, median Q=40.3"
+_PERCENT_RE = re.compile(r'(\d+\.?\d*)%')
+_MEAN_Q_RE = re.compile(r'mean Q=([\d.]+)')
+
+# Overall QC status -> slot in the PASS/WARN/FAIL tally
+_STATUS_INDEX = {
+    spelling: idx
+    for idx, status in enumerate(("PASS", "WARN", "FAIL"))
+    for spelling in (status, status.lower(), status.capitalize())
+}
+
+# Metric statuses counted as issues for a sample
+_ISSUE_STATUSES = frozenset(('WARN', 'FAIL'))
+
+# FASTQ file extensions, optionally compressed: .fastq, .fq.gz, .fastq.bz2, ...
+_FASTQ_EXT_RE = re.compile(r'\.(?:fastq|fq)(?:\.(?:gz|bz2))?$')
+
+# Default parallel chunk size for streamed sample lists, whose length is unknown
+_STREAMED_CHUNK_SIZE = 16
+
+
+@dataclass(**DATACLASS_SLOTS)
+class _SampleMetrics:
+    """Per-sample numbers the batch statistics are built from"""
+    gc: Optional[float] = None
+    quality: Optional[float] = None
+    duplication: Optional[float] = None
+    # Old-format analyses carry exact values in a details block; only those
+    # feed the outlier checks
+    gc_from_details: bool = False
+    quality_from_details: bool = False
+    
+    @classmethod
+    def from_metrics(cls, metrics: Dict[str, Any]) -> '_SampleMetrics':
+        """Extract values from an analysis' metrics (supports both old and new format)"""
+        values = cls()
+        
+        # GC content
+        if 'gc_content' in metrics:
+            # New format: parse "Normal GC content: 49.7% (expected ~52.0%)"
+            match = _PERCENT_RE.search(metrics['gc_content'].get('summary', ''))
+            if match:
+                values.gc = float(match.group(1))
+        elif 'GC Content' in metrics:
+            gc_metric = metrics['GC Content']
+            if 'details' in gc_metric and 'actual_gc' in gc_metric['details']:
+                values.gc = gc_metric['details']['actual_gc']
+                values.gc_from_details = True
+        
+        # Quality score
+        if 'per_base_quality' in metrics:
+            # New format: parse "Excellent quality: mean Q=39.4, median Q=40.3"
+            match = _MEAN_Q_RE.search(metrics['per_base_quality'].get('summary', ''))
+            if match:
+                values.quality = float(match.group(1))
+        elif 'Per Base Sequence Quality' in metrics:
+            quality_metric = metrics['Per Base Sequence Quality']
+            if 'details' in quality_metric and 'mean_quality' in quality_metric['details']:
+                values.quality = quality_metric['details']['mean_quality']
+                values.quality_from_details = True
+        
+        # Duplication rate
+        if 'duplication_levels' in metrics:
+            # New format: parse "High duplication: 86.1% (acceptable for RNA-seq/ChIP-seq)"
+            match = _PERCENT_RE.search(metrics['duplication_levels'].get('summary', ''))
+            if match:
+                values.duplication = float(match.group(1))
+        elif 'Sequence Duplication Levels' in metrics:
+            dup_metric = metrics['Sequence Duplication Levels']
+            if 'details' in dup_metric and 'percent_duplicates' in dup_metric['details']:
+                values.duplication = dup_metric['details']['percent_duplicates']
+        
+        return values
+
+
+def _load_sample_metrics(analysis_json: str) -> Optional[_SampleMetrics]:
+    """Metric values from an analysis file (None if missing or malformed)"""
+    try:
+        analysis_data = load_json(analysis_json)
+    except (json.JSONDecodeError, FileNotFoundError):
+        return None
+    return _SampleMetrics.from_metrics(analysis_data.get('metrics', {}))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchSampleResult:
     """Result for a single sample in batch processing"""
     sample_name: str
@@ -31,12 +123,27 @@ class BatchSampleResult:
     analysis_json: Optional[str] = None
     fixes_json: Optional[str] = None
     
+    # Values for the batch statistics, taken from the in-memory analysis so
+    # the report step need not re-read analysis.json (not serialized)
+    metric_values: Optional[_SampleMetrics] = field(default=None, repr=False)
+    
     def to_dict(self) -> Dict[str, Any]:
-
-        return asdict(self)
+        # Built by hand: asdict() reflects over fields for every sample
+        return {
+            "sample_name": self.sample_name,
+            "fastq_path": self.fastq_path,
+            "status": self.status,
+            "error_message": self.error_message,
+            "overall_status": self.overall_status,
+            "issues_found": self.issues_found,
+            "fixes_suggested": self.fixes_suggested,
+            "parsed_json": self.parsed_json,
+            "analysis_json": self.analysis_json,
+            "fixes_json": self.fixes_json,
+        }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchStatistics:
     """Aggregate statistics across all samples"""
     pass_count: int
@@ -62,7 +169,7 @@ class BatchStatistics:
         return asdict(self)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchReport:
     """Overall batch processing report"""
     total_samples: int
@@ -82,9 +189,8 @@ class BatchReport:
         if self.sample_results is None:
             self.sample_results = []
     
-    def to_dict(self) -> Dict[str, Any]:
-
-        result = {
+    def _run_info(self) -> Dict[str, Any]:
+        return {
             "total_samples": self.total_samples,
             "successful": self.successful,
             "failed": self.failed,
@@ -94,46 +200,120 @@ class BatchReport:
             "duration_seconds": self.duration_seconds,
             "organism": self.organism,
             "experiment_type": self.experiment_type,
-            "sample_results": [s.to_dict() for s in self.sample_results]
         }
+    
+    def to_dict(self) -> Dict[str, Any]:
+
+        result = self._run_info()
+        result["sample_results"] = [s.to_dict() for s in self.sample_results]
         
         if self.statistics:
             result["statistics"] = self.statistics.to_dict()
         
         return result
+    
+    def save(self, output_path) -> None:
+        """Write the report as JSON (same content as to_dict()).
+        
+        Sample results are encoded and written one per line as the file is
+        produced, so the full report never exists in memory at once.
+        """
+        with open(output_path, 'wb') as f:
+            f.write(b'{')
+            for key, value in self._run_info().items():
+                f.write(b'\n  ' + dumps_json_line(key) + b': ' + dumps_json_line(value) + b',')
+            f.write(b'\n  "sample_results": [')
+            for i, sample_result in enumerate(self.sample_results):
+                f.write(b',\n    ' if i else b'\n    ')
+                f.write(dumps_json_line(sample_result.to_dict()))
+            f.write(b'\n  ]')
+            if self.statistics:
+                f.write(b',\n  "statistics": ')
+                f.write(dumps_json_line(self.statistics.to_dict()))
+            f.write(b'\n}\n')
+
+
+class _RunningStats:
+    """Single-pass mean and sample standard deviation (Welford's algorithm)"""
+    __slots__ = ('count', 'mean', '_m2')
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+    
+    @property
+    def std(self) -> Optional[float]:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else None
 
 
 class BatchProcessor:
     """Process multiple samples in batch with optional parallelization"""
     
     def __init__(self, 
-                 sample_list: List[str],
+                 sample_list: Iterable[str],
                  output_dir: str,
                  organism: Optional[str] = None,
                  experiment_type: Optional[str] = None,
                  check_tools: bool = True,
                  parallel: int = 1,
+                 chunk_size: Optional[int] = None,
                  dry_run: bool = False,
                  verbose: bool = False):
         pass  # docstring removed
+        # Any iterable works (e.g. a streamed list file); it is only
+        # materialized when verbose progress output needs the sample count
+        if verbose and not isinstance(sample_list, Sized):
+            sample_list = list(sample_list)
         self.sample_list = sample_list
+        self._sample_count = len(sample_list) if isinstance(sample_list, Sized) else None
         self.output_dir = Path(output_dir)
         self.organism = organism
         self.experiment_type = experiment_type
         self.check_tools = check_tools
         self.parallel = parallel
+        if chunk_size is None:
+            # About four chunks per worker: few hand-offs, still balanced.
+            # Streamed inputs of unknown length use a fixed chunk size.
+            # parallel below 1 runs serially, so it counts as one worker
+            if self._sample_count:
+                chunk_size = -(-self._sample_count // (max(1, parallel) * 4))
+            else:
+                chunk_size = _STREAMED_CHUNK_SIZE
+        self.chunk_size = max(1, chunk_size)
         self.dry_run = dry_run
         self.verbose = verbose
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        # Every sample uses the same profiles; resolve them once here (workers
+        # receive them with the rest of the processor's settings)
+        self._thresholds = ProfileLoader().get_combined_thresholds(organism, experiment_type)
+        
         self.results: List[BatchSampleResult] = []
+        # Subdirectory names per scanned directory, for FastQC output lookups
+        self._subdir_names: Dict[str, frozenset] = {}
+    
+    def __getstate__(self):
+        # Parallel workers only need the settings (including the resolved
+        # thresholds), not the samples, collected results or directory cache
+        state = self.__dict__.copy()
+        state['sample_list'] = None
+        state['results'] = []
+        state['_subdir_names'] = {}
+        return state
     
     def process_sample(self, fastq_path: str, sample_idx: int) -> BatchSampleResult:
         pass  # docstring removed
         sample_name = Path(fastq_path).stem
         
         if self.verbose:
-            print(f"[{sample_idx}/{len(self.sample_list)}] Processing: {sample_name}")
+            print(f"[{sample_idx}/{self._sample_count}] Processing: {sample_name}")
         sample_dir = self.output_dir / sample_name
         sample_dir.mkdir(exist_ok=True)
         
@@ -154,51 +334,51 @@ class BatchProcessor:
                 return result
             
             # Step 2: Parse FastQC
-            parsed_path = sample_dir / "parsed.json"
+            # (output paths are kept as str: the result records them that way)
+            parsed_path = str(sample_dir / "parsed.json")
             parser = FastQCParser(fastqc_dir)
             parsed_report = parser.parse()
-            with open(parsed_path, 'w') as f:
-                f.write(parsed_report.to_json())
-            result.parsed_json = str(parsed_path)
+            dump_json(parsed_report.to_dict(), parsed_path)
+            result.parsed_json = parsed_path
             
             if self.verbose:
                 print(f"  ✓ Parsed FastQC data")
             
             # Step 3: Analyze with profiles
-            analysis_path = sample_dir / "analysis.json"
+            analysis_path = str(sample_dir / "analysis.json")
             analyzer = Analyzer(
-                str(parsed_path),
+                parsed_path,
                 organism=self.organism,
-                experiment_type=self.experiment_type
+                experiment_type=self.experiment_type,
+                thresholds=self._thresholds
             )
             analysis_result = analyzer.run()
             
-            with open(analysis_path, 'w') as f:
-                f.write(analysis_result.to_json())
-            result.analysis_json = str(analysis_path)
+            dump_json(analysis_result.to_dict(), analysis_path)
+            result.analysis_json = analysis_path
             result.overall_status = analysis_result.overall_status
+            result.metric_values = _SampleMetrics.from_metrics(analysis_result.metrics)
             
             # Count issues
             result.issues_found = sum(
                 1 for metric in analysis_result.metrics.values()
-                if metric.get('status') in ['WARN', 'FAIL']
+                if metric.get('status') in _ISSUE_STATUSES
             )
             
             if self.verbose:
                 print(f"  ✓ Analysis complete: {result.overall_status} ({result.issues_found} issues)")
             
             # Step 4: Generate fixes
-            fixes_path = sample_dir / "fixes.json"
+            fixes_path = str(sample_dir / "fixes.json")
             fixer = Fixer(
-                str(analysis_path),
+                analysis_path,
                 input_reads=fastq_path,
                 check_tools=self.check_tools
             )
             fixes_result = fixer.run()
             
-            with open(fixes_path, 'w') as f:
-                f.write(fixes_result.to_json())
-            result.fixes_json = str(fixes_path)
+            dump_json(fixes_result.to_dict(), fixes_path)
+            result.fixes_json = fixes_path
             result.fixes_suggested = len(fixes_result.fixes_applied)
             
             if self.verbose:
@@ -214,6 +394,10 @@ class BatchProcessor:
         
         return result
     
+    def _process_chunk(self, samples: List[str], first_idx: int) -> List[BatchSampleResult]:
+        # One parallel task: a run of consecutive samples
+        return [self.process_sample(sample, idx) for idx, sample in enumerate(samples, first_idx)]
+    
     def _find_fastqc_dir(self, fastq_path: str) -> Optional[str]:
         """Find FastQC output - accepts FastQC dirs/zips OR FASTQ files"""
         fastq_path = Path(fastq_path)
@@ -228,26 +412,34 @@ class BatchProcessor:
             return str(fastq_path)
         
         # Case 3: FASTQ file - look for corresponding FastQC directory
-        base_name = fastq_path.stem
-        
-        # Remove common FASTQ extensions
-        for ext in ['.fastq', '.fq', '.gz']:
-            if base_name.endswith(ext):
-                base_name = base_name[:-len(ext)]
+        # Remove the FASTQ extension (plus any compression suffix) in one go;
+        # other files just lose their last suffix
+        base_name = _FASTQ_EXT_RE.sub('', fastq_path.name)
+        if base_name == fastq_path.name:
+            base_name = fastq_path.stem
         
         # Look for FastQC directory
-        possible_dirs = [
-            fastq_path.parent / f"{base_name}_fastqc",
-            fastq_path.parent / "fastqc_output" / f"{base_name}_fastqc",
-            Path(f"{base_name}_fastqc")
-        ]
-        
-        for dir_path in possible_dirs:
-            if dir_path.exists() and dir_path.is_dir():
-                return str(dir_path)
+        dir_name = f"{base_name}_fastqc"
+        for parent in (fastq_path.parent, fastq_path.parent / "fastqc_output", Path(".")):
+            if dir_name in self._subdirectories(parent):
+                return str(parent / dir_name)
         
         return None
     
+    def _subdirectories(self, directory: Path) -> frozenset:
+        # Samples usually share a few parent directories, so each one is
+        # listed once rather than stat()-ing every candidate path
+        key = str(directory)
+        names = self._subdir_names.get(key)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = frozenset(entry.name for entry in entries if entry.is_dir())
+            except OSError:
+                names = frozenset()
+            self._subdir_names[key] = names
+        return names
+    
     def _calculate_statistics(self) -> BatchStatistics:
         """Calculate aggregate statistics from all results"""
         successful_results = [r for r in self.results if r.status == "success"]
@@ -255,150 +447,93 @@ class BatchProcessor:
         if not successful_results:
             return BatchStatistics(pass_count=0, warn_count=0, fail_count=0)
         
-        # Count PASS/WARN/FAIL (case-insensitive)
-        pass_count = sum(1 for r in successful_results if r.overall_status and r.overall_status.upper() == "PASS")
-        warn_count = sum(1 for r in successful_results if r.overall_status and r.overall_status.upper() == "WARN")
-        fail_count = sum(1 for r in successful_results if r.overall_status and r.overall_status.upper() == "FAIL")
-        
-        # Collect metrics from analysis JSONs
-        gc_values = []
-        quality_values = []
-        duplication_values = []
+        # Count PASS/WARN/FAIL (case-insensitive); the usual spellings are a
+        # plain dict lookup, anything else is upper-cased first
+        counts = [0, 0, 0, 0]
+        for r in successful_results:
+            status = r.overall_status
+            idx = _STATUS_INDEX.get(status)
+            if idx is None:
+                idx = _STATUS_INDEX.get(status.upper(), 3) if status else 3
+            counts[idx] += 1
+        pass_count, warn_count, fail_count, _ = counts
+        
+        # Accumulate metrics; samples processed in this run carry their
+        # values, others (e.g. results loaded elsewhere) are read from disk
+        gc_stats = _RunningStats()
+        quality_stats = _RunningStats()
+        duplication_stats = _RunningStats()
+        # (sample, value) pairs from the old-format details, which the
+        # outlier checks below compare against the batch statistics
+        gc_details = []
+        quality_details = []
+        
+        # Reads are I/O-bound, so any that are needed run a few at a time
+        to_load = [r for r in successful_results if r.metric_values is None and r.analysis_json]
+        loaded = {}
+        if to_load:
+            workers = min(32, (os.cpu_count() or 1) * 4, len(to_load))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                paths = [r.analysis_json for r in to_load]
+                for path, values in zip(paths, executor.map(_load_sample_metrics, paths)):
+                    loaded[path] = values
         
         for result in successful_results:
-            if not result.analysis_json:
-                continue
+            values = result.metric_values
+            if values is None:
+                values = loaded.get(result.analysis_json)
+                if values is None:
+                    continue
             
-            try:
-                with open(result.analysis_json, 'r') as f:
-                    analysis_data = json.load(f)
-                
-                # Extract GC content (supports both old and new format)
-                gc_val = None
-                if 'metrics' in analysis_data:
-                    # New format: gc_content with summary
-                    if 'gc_content' in analysis_data['metrics']:
-                        gc_metric = analysis_data['metrics']['gc_content']
-                        summary = gc_metric.get('summary', '')
-                        # Parse "Normal GC content: 49.7% (expected ~52.0%)"
-                        import re
-                        match = re.search(r'(\d+\.?\d*)%', summary)
-                        if match:
-                            gc_val = float(match.group(1))
-                    # Old format: GC Content with details
-                    elif 'GC Content' in analysis_data['metrics']:
-                        gc_metric = analysis_data['metrics']['GC Content']
-                        if 'details' in gc_metric and 'actual_gc' in gc_metric['details']:
-                            gc_val = gc_metric['details']['actual_gc']
-                
-                if gc_val is not None:
-                    gc_values.append(gc_val)
-                
-                # Extract quality score
-                quality_val = None
-                if 'metrics' in analysis_data:
-                    # New format: per_base_quality with summary
-                    if 'per_base_quality' in analysis_data['metrics']:
-                        quality_metric = analysis_data['metrics']['per_base_quality']
-                        summary = quality_metric.get('summary', '')
-                        # Parse "Excellent quality: mean Q=39.4, median Q=40.3"
-                        import re
-                        match = re.search(r'mean Q=([\d.]+)', summary)
-                        if match:
-                            quality_val = float(match.group(1))
-                    # Old format: Per Base Sequence Quality with details
-                    elif 'Per Base Sequence Quality' in analysis_data['metrics']:
-                        quality_metric = analysis_data['metrics']['Per Base Sequence Quality']
-                        if 'details' in quality_metric and 'mean_quality' in quality_metric['details']:
-                            quality_val = quality_metric['details']['mean_quality']
-                
-                if quality_val is not None:
-                    quality_values.append(quality_val)
-                
-                # Extract duplication rate
-                dup_val = None
-                if 'metrics' in analysis_data:
-                    # New format: duplication_levels with summary
-                    if 'duplication_levels' in analysis_data['metrics']:
-                        dup_metric = analysis_data['metrics']['duplication_levels']
-                        summary = dup_metric.get('summary', '')
-                        # Parse "High duplication: 86.1% (acceptable for RNA-seq/ChIP-seq)"
-                        import re
-                        match = re.search(r'(\d+\.?\d*)%', summary)
-                        if match:
-                            dup_val = float(match.group(1))
-                    # Old format: Sequence Duplication Levels with details
-                    elif 'Sequence Duplication Levels' in analysis_data['metrics']:
-                        dup_metric = analysis_data['metrics']['Sequence Duplication Levels']
-                        if 'details' in dup_metric and 'percent_duplicates' in dup_metric['details']:
-                            dup_val = dup_metric['details']['percent_duplicates']
-                
-                if dup_val is not None:
-                    duplication_values.append(dup_val)
-                
-            except (json.JSONDecodeError, FileNotFoundError, KeyError):
-                continue
+            if values.gc is not None:
+                gc_stats.add(values.gc)
+                if values.gc_from_details:
+                    gc_details.append((result.sample_name, values.gc))
+            if values.quality is not None:
+                quality_stats.add(values.quality)
+                if values.quality_from_details:
+                    quality_details.append((result.sample_name, values.quality))
+            if values.duplication is not None:
+                duplication_stats.add(values.duplication)
         
         # Calculate statistics
-        import statistics
-        
-        gc_mean = statistics.mean(gc_values) if gc_values else None
-        gc_std = statistics.stdev(gc_values) if len(gc_values) > 1 else None
+        gc_mean = gc_stats.mean if gc_stats.count else None
+        gc_std = gc_stats.std
         
-        quality_mean = statistics.mean(quality_values) if quality_values else None
-        quality_std = statistics.stdev(quality_values) if len(quality_values) > 1 else None
+        quality_mean = quality_stats.mean if quality_stats.count else None
+        quality_std = quality_stats.std
         
-        duplication_mean = statistics.mean(duplication_values) if duplication_values else None
-        duplication_std = statistics.stdev(duplication_values) if len(duplication_values) > 1 else None
+        duplication_mean = duplication_stats.mean if duplication_stats.count else None
+        duplication_std = duplication_stats.std
         
         # Detect outliers (values > 2 standard deviations from mean)
         outliers = []
         
-        if gc_mean and gc_std and gc_std > 0:
-            for result in successful_results:
-                if not result.analysis_json:
-                    continue
-                try:
-                    with open(result.analysis_json, 'r') as f:
-                        analysis_data = json.load(f)
-                    
-                    if 'metrics' in analysis_data and 'GC Content' in analysis_data['metrics']:
-                        gc_metric = analysis_data['metrics']['GC Content']
-                        if 'details' in gc_metric and 'actual_gc' in gc_metric['details']:
-                            gc_val = gc_metric['details']['actual_gc']
-                            deviation = abs(gc_val - gc_mean) / gc_std
-                            if deviation > 2.0:
-                                outliers.append({
-                                    'sample': result.sample_name,
-                                    'metric': 'GC content',
-                                    'value': f"{gc_val:.1f}%",
-                                    'reason': 'possible contamination' if gc_val < gc_mean else 'unusual GC distribution'
-                                })
-                except:
-                    pass
-        
-        if quality_mean and quality_std and quality_std > 0:
-            for result in successful_results:
-                if not result.analysis_json:
-                    continue
-                try:
-                    with open(result.analysis_json, 'r') as f:
-                        analysis_data = json.load(f)
-                    
-                    if 'metrics' in analysis_data and 'Per Base Sequence Quality' in analysis_data['metrics']:
-                        quality_metric = analysis_data['metrics']['Per Base Sequence Quality']
-                        if 'details' in quality_metric and 'mean_quality' in quality_metric['details']:
-                            q_val = quality_metric['details']['mean_quality']
-                            deviation = abs(q_val - quality_mean) / quality_std
-                            if deviation > 2.0 and q_val < 30:
-                                outliers.append({
-                                    'sample': result.sample_name,
-                                    'metric': 'Quality',
-                                    'value': f"Q{q_val:.1f}",
-                                    'reason': 'resequence recommended' if q_val < 28 else 'below average quality'
-                                })
-                except:
-                    pass
+        # Deviations are computed for all samples at once, compared against
+        # 2 standard deviations rather than divided into z-scores; only the
+        # flagged samples are visited in Python
+        if gc_mean and gc_std and gc_std > 0 and gc_details:
+            gc_values = np.array([gc_val for _, gc_val in gc_details], dtype=np.float64)
+            for idx in np.flatnonzero(np.abs(gc_values - gc_mean) > 2.0 * gc_std):
+                sample_name, gc_val = gc_details[idx]
+                outliers.append({
+                    'sample': sample_name,
+                    'metric': 'GC content',
+                    'value': f"{gc_val:.1f}%",
+                    'reason': 'possible contamination' if gc_val < gc_mean else 'unusual GC distribution'
+                })
+        
+        if quality_mean and quality_std and quality_std > 0 and quality_details:
+            q_values = np.array([q_val for _, q_val in quality_details], dtype=np.float64)
+            flagged = (np.abs(q_values - quality_mean) > 2.0 * quality_std) & (q_values < 30)
+            for idx in np.flatnonzero(flagged):
+                sample_name, q_val = quality_details[idx]
+                outliers.append({
+                    'sample': sample_name,
+                    'metric': 'Quality',
+                    'value': f"Q{q_val:.1f}",
+                    'reason': 'resequence recommended' if q_val < 28 else 'below average quality'
+                })
         
         return BatchStatistics(
             pass_count=pass_count,
@@ -431,35 +566,42 @@ class BatchProcessor:
             print(f"{'='*70}\n")
         
         if self.parallel > 1:
-            # Parallel processing
+            # Parallel processing: samples go to workers chunk_size at a time,
+            # with at most two chunks per worker in flight. Samples are pulled
+            # from the (possibly streamed) list only as chunks are submitted,
+            # and results are collected in input order
+            samples = iter(self.sample_list)
+            next_idx = 1
+            pending = deque()
             with ProcessPoolExecutor(max_workers=self.parallel) as executor:
-                futures = {
-                    executor.submit(self.process_sample, sample, idx+1): sample
-                    for idx, sample in enumerate(self.sample_list)
-                }
-                
-                for future in as_completed(futures):
-                    result = future.result()
-                    self.results.append(result)
+                while True:
+                    while len(pending) < self.parallel * 2:
+                        chunk = list(islice(samples, self.chunk_size))
+                        if not chunk:
+                            break
+                        pending.append(executor.submit(self._process_chunk, chunk, next_idx))
+                        next_idx += len(chunk)
+                    if not pending:
+                        break
+                    self.results.extend(pending.popleft().result())
         else:
-            # Sequential processing
-            for idx, sample in enumerate(self.sample_list):
-                result = self.process_sample(sample, idx+1)
-                self.results.append(result)
+            # Sequential processing (input order, like the parallel branch)
+            self.results.extend(map(self.process_sample, self.sample_list, count(1)))
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
         
         # Generate report
-        successful = sum(1 for r in self.results if r.status == "success")
-        failed = sum(1 for r in self.results if r.status == "failed")
-        skipped = sum(1 for r in self.results if r.status == "skipped")
+        status_counts = Counter(r.status for r in self.results)
+        successful = status_counts["success"]
+        failed = status_counts["failed"]
+        skipped = status_counts["skipped"]
         
         # Calculate aggregate statistics
         statistics = self._calculate_statistics()
         
         report = BatchReport(
-            total_samples=len(self.sample_list),
+            total_samples=len(self.results),
             successful=successful,
             failed=failed,
             skipped=skipped,
@@ -474,8 +616,7 @@ class BatchProcessor:
         
         # Save batch report
         report_path = self.output_dir / "batch_report.json"
-        with open(report_path, 'w') as f:
-            json.dump(report.to_dict(), f, indent=2)
+        report.save(report_path)
         
         if self.verbose:
             print(f"\n{'='*70}")
@@ -1,10 +1,14 @@
+import io
+import operator
 import os
 import zipfile
-import json
-from typing import Dict, List
-from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterable, List, Optional
+from dataclasses import dataclass, field
+from statistics import fmean
 
-@dataclass
+from phredator.utils.helpers import dumps_json, dumps_json_line, DATACLASS_SLOTS
+
+@dataclass(**DATACLASS_SLOTS)
 class FastQCReport:
     sample_name: str
     # Basic Statistics
@@ -34,10 +38,70 @@ class FastQCReport:
     duplication_levels: Dict[str, float] = field(default_factory=dict)
     adapter_content: Dict[str, float] = field(default_factory=dict)
     overrepresented_sequences: List[str] = field(default_factory=list)
+    # Cache for quality_mean; a slot field because slotted classes have no
+    # __dict__ for functools.cached_property. Not serialized by to_dict()
+    _quality_mean: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def quality_mean(self) -> float:
+        # Mean of the per-position mean qualities, computed on first access
+        if self._quality_mean is None:
+            self._quality_mean = (
+                fmean(pos_data['mean'] for pos_data in self.per_base_quality.values())
+                if self.per_base_quality else 0.0
+            )
+        return self._quality_mean
+    
+    def to_json(self, indent: Optional[int] = None) -> str:
+        # Compact by default: the per-position sections make indented
+        # output several times larger. Pass indent=2 for readable JSON
+        return dumps_json(self.to_dict(), indent=indent)
     
-    def to_json(self) -> str:
+    def to_json_bytes(self) -> bytes:
+        # Compact UTF-8 JSON, ready to write to a binary file handle
+        return dumps_json_line(self.to_dict())
+    
+    def to_dict(self) -> Dict:
+        # Built by hand: asdict() reflects over fields and deep-copies every
+        # per-position dict and distribution
+        return {
+            "sample_name": self.sample_name,
+            "filename": self.filename,
+            "file_type": self.file_type,
+            "encoding": self.encoding,
+            "total_sequences": self.total_sequences,
+            "total_bases": self.total_bases,
+            "sequences_flagged_poor_quality": self.sequences_flagged_poor_quality,
+            "sequence_length": self.sequence_length,
+            "percent_gc": self.percent_gc,
+            "per_base_quality": self.per_base_quality,
+            "per_base_sequence_content": self.per_base_sequence_content,
+            "per_sequence_quality_scores": self.per_sequence_quality_scores,
+            "per_base_n_content": self.per_base_n_content,
+            "sequence_length_distribution": self.sequence_length_distribution,
+            "gc_content_mean": self.gc_content_mean,
+            "gc_content_distribution": self.gc_content_distribution,
+            "total_deduplicated_percentage": self.total_deduplicated_percentage,
+            "duplication_levels": self.duplication_levels,
+            "adapter_content": self.adapter_content,
+            "overrepresented_sequences": self.overrepresented_sequences,
+        }
+
+
+# fastqc_data.txt module name -> section parsed into FastQCReport
+_MODULE_SECTIONS = {
+    'Basic Statistics': 'basic_statistics',
+    'Per base sequence quality': 'per_base_quality',
+    'Per base sequence content': 'per_base_sequence_content',
+    'Per sequence quality scores': 'per_sequence_quality_scores',
+    'Per base N content': 'per_base_n_content',
+    'Sequence Length Distribution': 'sequence_length_distribution',
+    'Per sequence GC content': 'gc_content',
+    'Sequence Duplication Levels': 'duplication_levels',
+    'Adapter Content': 'adapter_content',
+    'Overrepresented sequences': 'overrepresented_sequences',
+}
 
-        return json.dumps(asdict(self), indent=4)
 
 class FastQCParser:
     def __init__(self, filepath: str):
@@ -63,221 +127,217 @@ class FastQCParser:
                 if not data_file:
                     raise ValueError("fastqc_data.txt missing in zip")
                 
-                with z.open(data_file) as f:
-                    self._parse_fastqc_data(f.read().decode('utf-8'))
+                # Decode and parse line by line straight from the archive
+                with z.open(data_file) as raw, io.TextIOWrapper(raw, encoding='utf-8', newline='') as f:
+                    self._parse_fastqc_data(f)
         else:
             # Handle folder with fastqc_data.txt
             data_path = os.path.join(self.filepath, 'fastqc_data.txt')
             if not os.path.exists(data_path):
                 raise FileNotFoundError(f"{data_path} missing")
-            with open(data_path, 'r') as f:
-                self._parse_fastqc_data(f.read())
+            with open(data_path, 'r', newline='') as f:
+                self._parse_fastqc_data(f)
 
         return self.data
 
-    def _parse_fastqc_data(self, content: str):
-        """Internal method to parse fastqc_data.txt content."""
-        lines = content.splitlines()
-        section = None
+    def _parse_fastqc_data(self, lines: Iterable[str]):
+        """Internal method to parse fastqc_data.txt lines."""
+        # Module headers are resolved with one dict lookup and data lines go
+        # straight to their section's handler, instead of every line walking
+        # the full chain of header and section checks
+        handlers = {
+            'basic_statistics': self._parse_basic_statistics_line,
+            'per_base_quality': self._parse_per_base_quality_line,
+            'per_base_sequence_content': self._parse_per_base_sequence_content_line,
+            'per_sequence_quality_scores': self._parse_per_sequence_quality_scores_line,
+            'per_base_n_content': self._parse_per_base_n_content_line,
+            'sequence_length_distribution': self._parse_sequence_length_distribution_line,
+            'gc_content': self._parse_gc_content_line,
+            'duplication_levels': self._parse_duplication_levels_line,
+            'adapter_content': self._parse_adapter_content_line,
+            'overrepresented_sequences': self._parse_overrepresented_sequences_line,
+        }
+        handler = None
+        keeps_comments = False
 
         for line in lines:
-            line = line.strip()
-            if line.startswith('>>Basic Statistics'):
-                section = 'basic_statistics'
-                continue
-            elif line.startswith('>>Per base sequence quality'):
-                section = 'per_base_quality'
-                continue
-            elif line.startswith('>>Per base sequence content'):
-                section = 'per_base_sequence_content'
-                continue
-            elif line.startswith('>>Per sequence quality scores'):
-                section = 'per_sequence_quality_scores'
-                continue
-            elif line.startswith('>>Per base N content'):
-                section = 'per_base_n_content'
+            # FastQC lines carry no leading whitespace, only the line ending
+            line = line.rstrip()
+            if not line:
                 continue
-            elif line.startswith('>>Sequence Length Distribution'):
-                section = 'sequence_length_distribution'
+            if line.startswith('>>'):
+                # ">>Per base sequence quality\tpass" or ">>END_MODULE"
+                section = _MODULE_SECTIONS.get(line[2:].split('\t', 1)[0])
+                handler = handlers.get(section)
+                keeps_comments = section == 'duplication_levels'
                 continue
-            elif line.startswith('>>Per sequence GC content'):
-                section = 'gc_content'
+            if handler is None:
                 continue
-            elif line.startswith('>>Sequence Duplication Levels'):
-                section = 'duplication_levels'
-                continue
-            elif line.startswith('>>Adapter Content'):
-                section = 'adapter_content'
-                continue
-            elif line.startswith('>>Overrepresented sequences'):
-                section = 'overrepresented_sequences'
-                continue
-            elif line.startswith('>>END_MODULE'):
-                section = None
+            # Column headers are comments; only the duplication module keeps
+            # a value ("#Total Deduplicated Percentage") in one
+            if line[0] == '#' and not keeps_comments:
                 continue
+            handler(line)
 
-            if section == 'basic_statistics' and line and not line.startswith('#'):
-                # Format: "Measure\tValue"
-                parts = line.split('\t')
-                if len(parts) >= 2:
-                    measure = parts[0].strip()
-                    value = parts[1].strip()
-                    
-                    if measure == 'Filename':
-                        self.data.filename = value
-                    elif measure == 'File type':
-                        self.data.file_type = value
-                    elif measure == 'Encoding':
-                        self.data.encoding = value
-                    elif measure == 'Total Sequences':
-                        try:
-                            self.data.total_sequences = int(value)
-                        except ValueError:
-                            pass
-                    elif measure == 'Total Bases':
-                        self.data.total_bases = value
-                    elif measure == 'Sequences flagged as poor quality':
-                        try:
-                            self.data.sequences_flagged_poor_quality = int(value)
-                        except ValueError:
-                            pass
-                    elif measure == 'Sequence length':
-                        self.data.sequence_length = value
-                    elif measure == '%GC':
-                        try:
-                            self.data.percent_gc = int(value)
-                        except ValueError:
-                            pass
+        # Calculate mean GC content from distribution
+        self._calculate_gc_mean()
 
-            elif section == 'per_base_quality' and line and not line.startswith('#'):
-                parts = line.split()
-                if len(parts) >= 3:
-                    base_range = parts[0]
-                    mean_quality = float(parts[1])
-                    median_quality = float(parts[2])
-                    self.data.per_base_quality[base_range] = {
-                        'mean': mean_quality,
-                        'median': median_quality
-                    }
+    def _parse_basic_statistics_line(self, line: str):
+        # Format: "Measure\tValue"
+        parts = line.split('\t')
+        if len(parts) >= 2:
+            measure = parts[0].strip()
+            value = parts[1].strip()
+            
+            if measure == 'Filename':
+                self.data.filename = value
+            elif measure == 'File type':
+                self.data.file_type = value
+            elif measure == 'Encoding':
+                self.data.encoding = value
+            elif measure == 'Total Sequences':
+                try:
+                    self.data.total_sequences = int(value)
+                except ValueError:
+                    pass
+            elif measure == 'Total Bases':
+                self.data.total_bases = value
+            elif measure == 'Sequences flagged as poor quality':
+                try:
+                    self.data.sequences_flagged_poor_quality = int(value)
+                except ValueError:
+                    pass
+            elif measure == 'Sequence length':
+                self.data.sequence_length = value
+            elif measure == '%GC':
+                try:
+                    self.data.percent_gc = int(value)
+                except ValueError:
+                    pass
 
-            elif section == 'per_base_sequence_content' and line and not line.startswith('#'):
-                # Format: "#Base\tG\tA\tT\tC"
-                # Data: "1\t22.36\t28.37\t27.67\t21.6"
-                parts = line.split()
-                if len(parts) >= 5:
-                    try:
-                        base_position = parts[0]  # e.g., "1", "10-14"
-                        g_percent = float(parts[1])
-                        a_percent = float(parts[2])
-                        t_percent = float(parts[3])
-                        c_percent = float(parts[4])
-                        self.data.per_base_sequence_content[base_position] = {
-                            'G': g_percent,
-                            'A': a_percent,
-                            'T': t_percent,
-                            'C': c_percent
-                        }
-                    except ValueError:
-                        continue
+    def _parse_per_base_quality_line(self, line: str):
+        parts = line.split()
+        if len(parts) >= 3:
+            base_range = parts[0]
+            mean_quality, median_quality = map(float, parts[1:3])
+            self.data.per_base_quality[base_range] = {
+                'mean': mean_quality,
+                'median': median_quality
+            }
 
-            elif section == 'per_sequence_quality_scores' and line and not line.startswith('#'):
-                # Format: "#Quality\tCount"
-                # Data: "33\t4.0", "34\t8883.0"
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        quality = int(parts[0])
-                        count = float(parts[1])
-                        self.data.per_sequence_quality_scores[quality] = count
-                    except ValueError:
-                        continue
+    def _parse_per_base_sequence_content_line(self, line: str):
+        # Format: "#Base\tG\tA\tT\tC"
+        # Data: "1\t22.36\t28.37\t27.67\t21.6"
+        parts = line.split()
+        if len(parts) >= 5:
+            try:
+                base_position = parts[0]  # e.g., "1", "10-14"
+                g_percent, a_percent, t_percent, c_percent = map(float, parts[1:5])
+                self.data.per_base_sequence_content[base_position] = {
+                    'G': g_percent,
+                    'A': a_percent,
+                    'T': t_percent,
+                    'C': c_percent
+                }
+            except ValueError:
+                return
 
-            elif section == 'per_base_n_content' and line and not line.startswith('#'):
-                # Format: "#Base\tN-Count"
-                # Data: "1\t0.0", "10-14\t0.0"
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        base_position = parts[0]
-                        n_count = float(parts[1])
-                        self.data.per_base_n_content[base_position] = n_count
-                    except ValueError:
-                        continue
+    def _parse_per_sequence_quality_scores_line(self, line: str):
+        # Format: "#Quality\tCount"
+        # Data: "33\t4.0", "34\t8883.0"
+        parts = line.split()
+        if len(parts) >= 2:
+            try:
+                quality = int(parts[0])
+                count = float(parts[1])
+                self.data.per_sequence_quality_scores[quality] = count
+            except ValueError:
+                return
 
-            elif section == 'sequence_length_distribution' and line and not line.startswith('#'):
-                # Format: "#Length\tCount"
-                # Data: "150\t10000.0" or "40-49\t123.0"
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        length = parts[0]  # Can be "150" or "40-49"
-                        count = float(parts[1])
-                        self.data.sequence_length_distribution[length] = count
-                    except ValueError:
-                        continue
+    def _parse_per_base_n_content_line(self, line: str):
+        # Format: "#Base\tN-Count"
+        # Data: "1\t0.0", "10-14\t0.0"
+        parts = line.split()
+        if len(parts) >= 2:
+            try:
+                base_position = parts[0]
+                n_count = float(parts[1])
+                self.data.per_base_n_content[base_position] = n_count
+            except ValueError:
+                return
 
-            elif section == 'gc_content' and line and not line.startswith('#'):
-                # Format: "#GC Content\tCount"
-                # Parse full distribution: GC% (0-100) -> count of sequences
-                parts = line.split()
-                if len(parts) >= 2:
-                    try:
-                        gc_percent = int(parts[0])  # GC percentage (0-100)
-                        count = float(parts[1])      # Number of sequences
-                        if count > 0:
-                            self.data.gc_content_distribution[gc_percent] = count
-                    except ValueError:
-                        continue  # skip malformed lines
+    def _parse_sequence_length_distribution_line(self, line: str):
+        # Format: "#Length\tCount"
+        # Data: "150\t10000.0" or "40-49\t123.0"
+        parts = line.split()
+        if len(parts) >= 2:
+            try:
+                length = parts[0]  # Can be "150" or "40-49"
+                count = float(parts[1])
+                self.data.sequence_length_distribution[length] = count
+            except ValueError:
+                return
 
-            elif section == 'duplication_levels' and line:
-                # Special case: "#Total Deduplicated Percentage\t0.03"
-                if line.startswith('#Total Deduplicated Percentage'):
-                    parts = line.split('\t')
-                    if len(parts) >= 2:
-                        try:
-                            self.data.total_deduplicated_percentage = float(parts[1])
-                        except ValueError:
-                            continue
-                # Skip other header lines
-                elif line.startswith('#'):
-                    continue
-                # Data lines: "1\t100.0", "2\t0.0", ">10\t5.0", etc.
-                else:
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        try:
-                            duplication_level = parts[0]  # e.g., "1", "2", ">10", ">10k+"
-                            percentage = float(parts[1])   # Percentage of total sequences at this level
-                            self.data.duplication_levels[duplication_level] = percentage
-                        except ValueError:
-                            continue
+    def _parse_gc_content_line(self, line: str):
+        # Format: "#GC Content\tCount"
+        # Parse full distribution: GC% (0-100) -> count of sequences
+        parts = line.split()
+        if len(parts) >= 2:
+            try:
+                gc_percent = int(parts[0])  # GC percentage (0-100)
+                count = float(parts[1])      # Number of sequences
+                if count > 0:
+                    self.data.gc_content_distribution[gc_percent] = count
+            except ValueError:
+                return  # skip malformed lines
 
-            elif section == 'adapter_content' and line and not line.startswith('#'):
-                parts = line.split()
-                if len(parts) >= 2:
-                    adapter = parts[0]
-                    try:
-                        fraction = float(parts[1])
-                        self.data.adapter_content[adapter] = fraction
-                    except ValueError:
-                        continue
+    def _parse_duplication_levels_line(self, line: str):
+        # Special case: "#Total Deduplicated Percentage\t0.03"
+        if line.startswith('#Total Deduplicated Percentage'):
+            parts = line.split('\t')
+            if len(parts) >= 2:
+                try:
+                    self.data.total_deduplicated_percentage = float(parts[1])
+                except ValueError:
+                    return
+        # Skip other header lines
+        elif line[0] == '#':
+            return
+        # Data lines: "1\t100.0", "2\t0.0", ">10\t5.0", etc.
+        else:
+            parts = line.split()
+            if len(parts) >= 2:
+                try:
+                    duplication_level = parts[0]  # e.g., "1", "2", ">10", ">10k+"
+                    percentage = float(parts[1])   # Percentage of total sequences at this level
+                    self.data.duplication_levels[duplication_level] = percentage
+                except ValueError:
+                    return
 
-            elif section == 'overrepresented_sequences' and line and not line.startswith('#'):
-                seq = line.split()[0]  # sequence is the first column
-                self.data.overrepresented_sequences.append(seq)
+    def _parse_adapter_content_line(self, line: str):
+        parts = line.split()
+        if len(parts) >= 2:
+            adapter = parts[0]
+            try:
+                fraction = float(parts[1])
+                self.data.adapter_content[adapter] = fraction
+            except ValueError:
+                return
 
-        # Calculate mean GC content from distribution
-        self._calculate_gc_mean()
+    def _parse_overrepresented_sequences_line(self, line: str):
+        seq = line.split()[0]  # sequence is the first column
+        self.data.overrepresented_sequences.append(seq)
 
     def _calculate_gc_mean(self):
 
         if not self.data.gc_content_distribution:
             return
         
-        total_sequences = sum(self.data.gc_content_distribution.values())
+        distribution = self.data.gc_content_distribution
+        total_sequences = sum(distribution.values())
         if total_sequences == 0:
             return
         
-        weighted_sum = sum(gc_pct * count 
-                          for gc_pct, count in self.data.gc_content_distribution.items())
+        # Products and sum run in C (map + operator.mul), not a generator
+        weighted_sum = sum(map(operator.mul, distribution.keys(), distribution.values()))
         self.data.gc_content_mean = weighted_sum / total_sequences
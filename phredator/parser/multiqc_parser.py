@@ -1,10 +1,19 @@
 """
 MultiQC parser for aggregate QC analysis.
 """
-import json
-from typing import Dict, List
+from typing import Dict, List, Optional
 from pathlib import Path
 
+from phredator.utils.helpers import load_json
+
+# MultiQC general-stats metric -> key in the extracted per-sample data
+_GENERAL_STATS_METRICS = (
+    ('percent_gc', 'gc_content'),
+    ('percent_duplicates', 'duplication'),
+    ('avg_sequence_length', 'sequence_length'),
+    ('total_sequences', 'total_sequences'),
+)
+
 
 class MultiQCParser:
     """Parse MultiQC JSON output for aggregate analysis."""
@@ -18,11 +27,15 @@ class MultiQCParser:
         """
         self.multiqc_json_path = multiqc_json_path
         self.data = None
+        self._parsed: Optional[Dict] = None
     
     def parse(self) -> Dict:
         """Parse MultiQC JSON and extract FastQC data."""
-        with open(self.multiqc_json_path, 'r') as f:
-            self.data = json.load(f)
+        # MultiQC files can be very large; load and walk them only once
+        if self._parsed is not None:
+            return self._parsed
+        
+        self.data = load_json(self.multiqc_json_path)
         
         # Extract FastQC-specific data
         fastqc_data = {}
@@ -31,30 +44,22 @@ class MultiQCParser:
         if 'report_general_stats_data' in self.data:
             for sample_data in self.data['report_general_stats_data']:
                 for sample_name, metrics in sample_data.items():
-                    if sample_name not in fastqc_data:
-                        fastqc_data[sample_name] = {}
+                    entry = fastqc_data.setdefault(sample_name, {})
                     
                     # Extract relevant metrics
-                    if 'percent_gc' in metrics:
-                        fastqc_data[sample_name]['gc_content'] = metrics['percent_gc']
-                    if 'percent_duplicates' in metrics:
-                        fastqc_data[sample_name]['duplication'] = metrics['percent_duplicates']
-                    if 'avg_sequence_length' in metrics:
-                        fastqc_data[sample_name]['sequence_length'] = metrics['avg_sequence_length']
-                    if 'total_sequences' in metrics:
-                        fastqc_data[sample_name]['total_sequences'] = metrics['total_sequences']
+                    for source, key in _GENERAL_STATS_METRICS:
+                        if source in metrics:
+                            entry[key] = metrics[source]
         
-        return {
+        self._parsed = {
             'samples': fastqc_data,
             'total_samples': len(fastqc_data),
             'multiqc_version': self.data.get('config_version', 'unknown')
         }
+        return self._parsed
     
     def get_summary_statistics(self) -> Dict:
         """Calculate summary statistics from MultiQC data."""
-        if not self.data:
-            self.parse()
-        
         parsed = self.parse()
         samples = parsed['samples']
         
@@ -17,6 +17,7 @@ from pathlib import Path
 from phredator.parser.fastqc_parser import FastQCParser
 from phredator.analyzer.qc_analyzer import Analyzer
 from phredator.fixer.qc_fixer import Fixer
+from phredator.utils.helpers import load_json
 
 
 @dataclass
@@ -208,8 +209,8 @@ class PipelineRunner:
             parser = FastQCParser(str(self.fastqc_dir))
             parsed = parser.parse()
             
-            with open(self.before_parsed, 'w') as f:
-                f.write(parsed.to_json())
+            with open(self.before_parsed, 'wb') as f:
+                f.write(parsed.to_json_bytes())
             
             step.status = "success"
             step.output = str(self.before_parsed)
@@ -280,8 +281,7 @@ class PipelineRunner:
         
         try:
             # Load fixes
-            with open(self.fixes_json, 'r') as f:
-                fixes_data = json.load(f)
+            fixes_data = load_json(self.fixes_json)
             
             fixes = fixes_data.get('fixes_applied', [])
             
@@ -368,8 +368,8 @@ class PipelineRunner:
             parser = FastQCParser(str(self.after_fastqc_dir))
             parsed = parser.parse()
             
-            with open(self.after_parsed, 'w') as f:
-                f.write(parsed.to_json())
+            with open(self.after_parsed, 'wb') as f:
+                f.write(parsed.to_json_bytes())
             
             step.status = "success"
             step.output = str(self.after_parsed)
@@ -412,10 +412,8 @@ class PipelineRunner:
         
         try:
             # Load analyses
-            with open(self.before_analysis, 'r') as f:
-                before = json.load(f)
-            with open(self.after_analysis, 'r') as f:
-                after = json.load(f)
+            before = load_json(self.before_analysis)
+            after = load_json(self.after_analysis)
             
             comparisons = []
             improved = 0
@@ -1,11 +1,12 @@
 
 
-import json
 import csv
 import os
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from phredator.utils.helpers import dump_json
+
 
 class Reporter:
     
@@ -27,8 +28,7 @@ class Reporter:
             "data": self.data
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=4)
+        dump_json(report, output_path, indent=4)
     
     def generate_csv_report(self, output_path: str) -> None:
         pass  # docstring removed
@@ -1 +1,62 @@
-"""Helpers placeholder"""
+"""Shared helpers"""
+
+import json
+import sys
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; fall back to the stdlib json module
+    orjson = None
+
+# Buffer for streamed stdlib JSON output, which json.dump writes in many small pieces
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get regular dataclasses
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+if orjson is not None:
+    # FastQC distributions use int keys, which orjson rejects by default;
+    # NumPy scalars and arrays can reach the output from the analysis code
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _json_default(obj: Any) -> Any:
+    """Stdlib json fallback for NumPy scalars and arrays (what OPT_SERIALIZE_NUMPY covers)"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def load_json(path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def dumps_json(obj: Any, indent: Optional[int] = 2) -> str:
+    """Serialize to a JSON string (compact when indent is None), using orjson when it is installed."""
+    if orjson is not None and indent in (None, 2):
+        option = _ORJSON_OPTIONS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, indent=indent, default=_json_default)
+
+
+def dumps_json_line(obj: Any) -> bytes:
+    """Serialize to compact single-line UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=_json_default).encode('utf-8')
+
+
+def dump_json(obj: Any, path: str, indent: int = 2) -> None:
+    """Write obj as indented JSON to path without building an intermediate str."""
+    if orjson is not None and indent == 2:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w', buffering=_WRITE_BUFFER_SIZE) as f:
+        json.dump(obj, f, indent=indent, default=_json_default)
@@ -61,6 +61,27 @@ class ExperimentProfile:
         )
 
 
+# profile directory -> (mtime, sorted profile names)
+_PROFILE_NAME_CACHE: Dict[str, Tuple[float, List[str]]] = {}
+
+
+def _cached_profile_names(profile_dir: str) -> List[str]:
+    # Name lookups happen for every fuzzy match and profile load; list the
+    # directory again only when its mtime says a profile was added or removed
+    try:
+        mtime = os.stat(profile_dir).st_mtime
+    except OSError:
+        return []
+    
+    cached = _PROFILE_NAME_CACHE.get(profile_dir)
+    if cached is None or cached[0] != mtime:
+        names = sorted(filename[:-len('.yaml')] for filename in os.listdir(profile_dir)
+                       if filename.endswith('.yaml'))
+        cached = (mtime, names)
+        _PROFILE_NAME_CACHE[profile_dir] = cached
+    return list(cached[1])
+
+
 class ProfileLoader:
     
     def __init__(self):
@@ -68,15 +89,29 @@ class ProfileLoader:
         self.config_dir = os.path.join(os.path.dirname(current_dir), 'config')
         self.organism_dir = os.path.join(self.config_dir, 'organisms')
         self.experiment_dir = os.path.join(self.config_dir, 'experiment_types')
+        self._normalized_indexes: Dict[Tuple[str, ...], Dict[str, str]] = {}
     
     def _normalize_input(self, value: str) -> str:
         # rna-seq, RNA_SEQ, RnaSeq all become rnaseq
         return value.strip().lower().replace('-', '').replace('_', '').replace(' ', '')
     
+    def _normalized_index(self, available_values: List[str]) -> Dict[str, str]:
+        # normalized name -> original name, built once per candidate list
+        key = tuple(available_values)
+        index = self._normalized_indexes.get(key)
+        if index is None:
+            index = {self._normalize_input(v): v for v in available_values}
+            self._normalized_indexes[key] = index
+        return index
+    
     def _find_closest_match(self, input_value: str, available_values: List[str]) -> Optional[str]:
-        normalized_input = self._normalize_input(input_value)
-        normalized_available = {self._normalize_input(v): v for v in available_values}
+        normalized_available = self._normalized_index(available_values)
         
+        # Exact and normalized hits ("human", "Human", "RNA seq") skip fuzzy scoring
+        if normalized_available.get(input_value) == input_value:
+            return input_value
+        
+        normalized_input = self._normalize_input(input_value)
         if normalized_input in normalized_available:
             return normalized_available[normalized_input]
         
@@ -88,7 +123,7 @@ class ProfileLoader:
     
     def _get_suggestions(self, input_value: str, available_values: List[str], top_n: int = 3) -> List[str]:
         normalized_input = self._normalize_input(input_value)
-        normalized_available = {self._normalize_input(v): v for v in available_values}
+        normalized_available = self._normalized_index(available_values)
         
         matches = get_close_matches(normalized_input, normalized_available.keys(), n=top_n, cutoff=0.4)
         return [normalized_available[m] for m in matches]
@@ -154,24 +189,10 @@ class ProfileLoader:
             return None
     
     def list_organisms(self) -> list:
-        if not os.path.exists(self.organism_dir):
-            return []
-        
-        profiles = []
-        for filename in os.listdir(self.organism_dir):
-            if filename.endswith('.yaml'):
-                profiles.append(filename.replace('.yaml', ''))
-        return sorted(profiles)
+        return _cached_profile_names(self.organism_dir)
     
     def list_experiment_types(self) -> list:
-        if not os.path.exists(self.experiment_dir):
-            return []
-        
-        profiles = []
-        for filename in os.listdir(self.experiment_dir):
-            if filename.endswith('.yaml'):
-                profiles.append(filename.replace('.yaml', ''))
-        return sorted(profiles)
+        return _cached_profile_names(self.experiment_dir)
     
     def get_combined_thresholds(self, 
                                 organism: Optional[str] = None,
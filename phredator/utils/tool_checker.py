@@ -4,6 +4,7 @@ import subprocess
 import shutil
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass
@@ -23,6 +24,7 @@ class ToolChecker:
     
     def __init__(self):
         self._checked = {}
+        self._alternatives: Dict[str, List[str]] = {}
         self.tools = {
             'fastqc': ToolInfo(
                 name="FastQC",
@@ -216,10 +218,18 @@ class ToolChecker:
         if tool_category not in alternatives:
             return []
         
-        # Return installed tools in preference order
-        installed = []
-        for tool_key in alternatives[tool_category]:
-            if self.check_tool(tool_key):
-                installed.append(tool_key)
+        # Return installed tools in preference order (cached per category)
+        if tool_category not in self._alternatives:
+            self._alternatives[tool_category] = [
+                tool_key for tool_key in alternatives[tool_category]
+                if self.check_tool(tool_key)
+            ]
         
-        return installed
+        return list(self._alternatives[tool_category])
+
+
+@lru_cache(maxsize=None)
+def shared_tool_checker() -> ToolChecker:
+    """Process-wide ToolChecker, so PATH and version probes run once per tool
+    rather than once per sample in batch runs."""
+    return ToolChecker()
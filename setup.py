@@ -31,6 +31,9 @@ setup(
         "numpy>=1.20.0",
         "PyYAML>=5.4.0",
     ],
+    extras_require={
+        'fast': ["orjson>=3.0.0", "numba>=0.55.0"],
+    },
     python_requires=">=3.8",
     keywords=[
         'bioinformatics', 'ngs', 'quality-control', 'fastqc', 'sequencing', 
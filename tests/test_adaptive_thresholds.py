@@ -2,10 +2,13 @@
 Tests for Adaptive Quality Threshold Calibration
 """
 
+import statistics
+
 import pytest
 from phredator.analyzer.adaptive_thresholds import (
     AdaptiveThresholdCalibrator,
-    ThresholdCalibration
+    ThresholdCalibration,
+    extract_quality_means
 )
 
 
@@ -36,6 +39,10 @@ def test_outlier_detection():
     
     assert 5 in outliers
     assert len(outliers) >= 1
+    
+    # Precomputed median/MAD give the same answer
+    median, mad = statistics.median(values), calibrator.calculate_mad(values)
+    assert calibrator.detect_outliers_mad(values, median=median, mad=mad) == outliers
 
 
 def test_trend_detection_stable():
@@ -163,6 +170,51 @@ def test_empty_data():
     assert result.trend == "unknown"
 
 
+def test_calibration_from_array_matches_dict():
+    """Test calibration accepts a pre-extracted quality array"""
+    calibrator = AdaptiveThresholdCalibrator()
+    
+    per_base_quality = {
+        f"pos_{i}": {"mean": 38 - i * 0.15}
+        for i in range(100)
+    }
+    
+    from_dict = calibrator.calibrate_from_per_base_quality(per_base_quality)
+    from_array = calibrator.calibrate_from_per_base_quality(
+        extract_quality_means(per_base_quality)
+    )
+    
+    assert from_array == from_dict
+
+
+def test_calibrate_batch_matches_single():
+    """Test batch calibration agrees with per-sample calibration"""
+    calibrator = AdaptiveThresholdCalibrator()
+    
+    samples = [
+        {f"pos_{i}": {"mean": 38 - i * 0.15} for i in range(100)},
+        {f"pos_{i}": {"mean": 22 + i * 0.01} for i in range(40)},
+        {f"pos_{i}": {"mean": 15 if i >= 95 else 35} for i in range(100)},
+        {f"pos_{i}": {"mean": 30 if i % 2 else 38} for i in range(60)},
+        {},
+    ]
+    
+    results = calibrator.calibrate_batch(samples)
+    
+    assert len(results) == len(samples)
+    for sample, result in zip(samples, results):
+        expected = calibrator.calibrate_from_per_base_quality(sample)
+        assert result.mean_quality == pytest.approx(expected.mean_quality)
+        assert result.std_dev == pytest.approx(expected.std_dev)
+        assert result.median == pytest.approx(expected.median)
+        assert result.mad == pytest.approx(expected.mad)
+        assert result.trend_rate == pytest.approx(expected.trend_rate)
+        assert result.recommended_threshold == pytest.approx(expected.recommended_threshold)
+        assert result.outlier_positions == expected.outlier_positions
+        assert result.trend == expected.trend
+        assert result.confidence_level == expected.confidence_level
+
+
 def test_real_world_scenario():
     """Test with realistic Illumina data pattern"""
     calibrator = AdaptiveThresholdCalibrator()
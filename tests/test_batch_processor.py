@@ -0,0 +1,198 @@
+"""
+Tests for batch report output and batch statistics
+"""
+
+import json
+import statistics
+from dataclasses import asdict
+
+import pytest
+from phredator.utils import helpers
+from phredator.parser.batch_processor import (
+    BatchProcessor,
+    BatchReport,
+    BatchSampleResult,
+    BatchStatistics,
+    _RunningStats,
+    _SampleMetrics,
+    _load_sample_metrics,
+)
+
+
+def _old_format_analysis(gc=None, quality=None, duplication=None):
+    """Analysis JSON in the old format, whose details feed the outlier checks"""
+    metrics = {}
+    if gc is not None:
+        metrics['GC Content'] = {'details': {'actual_gc': gc}}
+    if quality is not None:
+        metrics['Per Base Sequence Quality'] = {'details': {'mean_quality': quality}}
+    if duplication is not None:
+        metrics['Sequence Duplication Levels'] = {'details': {'percent_duplicates': duplication}}
+    return {'metrics': metrics}
+
+
+NEW_FORMAT_ANALYSIS = {
+    'metrics': {
+        'gc_content': {'summary': 'Normal GC content: 45.3% (expected ~52.0%)'},
+        'per_base_quality': {'summary': 'Excellent quality: mean Q=36.0, median Q=37.0'},
+        'duplication_levels': {'summary': 'Duplication: 25.0%'},
+    }
+}
+
+# Fixture batch: consistent samples, a high-GC, a low-GC and a low-quality
+# outlier, plus missing metrics, a new-format analysis, malformed JSON and
+# a missing file
+BATCH_ANALYSES = {
+    's01': _old_format_analysis(45.0, 36.0, 20.0),
+    's02': _old_format_analysis(46.0, 35.5, 22.0),
+    's03': _old_format_analysis(44.5, 36.5, 21.0),
+    's04': _old_format_analysis(45.5, 35.8, 19.0),
+    's05': _old_format_analysis(45.2, 36.2, 20.5),
+    's06': _old_format_analysis(44.8, 35.9, 20.0),
+    's07': _old_format_analysis(46.2, 36.1, 23.0),
+    's08': _old_format_analysis(45.1, 35.7, 20.0),
+    's09': _old_format_analysis(60.0, 36.0, 21.0),
+    's10': _old_format_analysis(45.0, 20.0, 20.0),
+    's11': _old_format_analysis(quality=36.0),
+    's12': {'metrics': {}},
+    's13': NEW_FORMAT_ANALYSIS,
+    's14': '{"metrics": {',
+    's15': None,
+    's16': _old_format_analysis(30.0, 29.0),
+}
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_report_save_round_trips(tmp_path, monkeypatch, use_orjson):
+    """Test the streamed batch_report.json loads back equal to the report"""
+    if not use_orjson:
+        monkeypatch.setattr(helpers, "orjson", None)
+    elif helpers.orjson is None:
+        pytest.skip("orjson not installed")
+    
+    report = BatchReport(
+        total_samples=3,
+        successful=2,
+        failed=1,
+        skipped=0,
+        start_time="2024-01-01T10:00:00",
+        end_time="2024-01-01T10:05:00",
+        duration_seconds=300.5,
+        organism="human",
+        experiment_type=None,
+        statistics=BatchStatistics(
+            pass_count=1, warn_count=1, fail_count=0,
+            gc_mean=45.5, gc_std=2.1,
+            outliers=[{'sample': 's1', 'metric': 'GC content', 'value': '51.0%', 'reason': 'unusual GC distribution'}]
+        ),
+        sample_results=[
+            BatchSampleResult(sample_name="s1", fastq_path="s1.fastq.gz", status="success",
+                              overall_status="PASS", analysis_json="out/s1/analysis.json"),
+            BatchSampleResult(sample_name="s2 \"quoted\" ü", fastq_path="s2.fastq.gz", status="success",
+                              overall_status="WARN", issues_found=2, fixes_suggested=1),
+            BatchSampleResult(sample_name="s3", fastq_path="s3.fastq.gz", status="failed",
+                              error_message="No FastQC data found"),
+        ]
+    )
+    
+    output_path = tmp_path / "batch_report.json"
+    report.save(output_path)
+    with open(output_path) as f:
+        saved = json.load(f)
+    
+    expected = asdict(report)
+    # metric_values only feeds the statistics and is never written
+    for sample in expected["sample_results"]:
+        del sample["metric_values"]
+    
+    assert saved == expected
+    assert saved == report.to_dict()
+
+
+def test_running_stats_match_statistics_module():
+    """Test Welford mean/std against the statistics module on a known sample"""
+    values = [38.2, 35.9, 41.0, 36.4, 22.7, 39.8, 37.1, 40.3]
+    
+    stats = _RunningStats()
+    for value in values:
+        stats.add(value)
+    
+    assert stats.count == len(values)
+    assert stats.mean == pytest.approx(statistics.mean(values))
+    # The batch report has always used the sample standard deviation
+    assert stats.std == pytest.approx(statistics.stdev(values))
+    assert stats.std * ((len(values) - 1) / len(values)) ** 0.5 == pytest.approx(statistics.pstdev(values))
+    
+    # Too few values for a standard deviation
+    single = _RunningStats()
+    single.add(30.0)
+    assert single.mean == 30.0
+    assert single.std is None
+
+
+def test_sample_metrics_from_metrics():
+    """Test value extraction from new- and old-format analysis metrics"""
+    new = _SampleMetrics.from_metrics(NEW_FORMAT_ANALYSIS['metrics'])
+    assert (new.gc, new.quality, new.duplication) == (45.3, 36.0, 25.0)
+    assert not new.gc_from_details and not new.quality_from_details
+    
+    old = _SampleMetrics.from_metrics(_old_format_analysis(44.0, 30.5, 12.0)['metrics'])
+    assert (old.gc, old.quality, old.duplication) == (44.0, 30.5, 12.0)
+    assert old.gc_from_details and old.quality_from_details
+    
+    # Missing metrics, details and unparsable summaries give None
+    partial = _SampleMetrics.from_metrics({
+        'gc_content': {'summary': 'GC content unavailable'},
+        'Per Base Sequence Quality': {'details': {}},
+    })
+    assert (partial.gc, partial.quality, partial.duplication) == (None, None, None)
+
+
+def test_load_sample_metrics(tmp_path):
+    """Test missing and malformed analysis files load as None"""
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps(_old_format_analysis(45.0, 36.0)))
+    malformed = tmp_path / "malformed.json"
+    malformed.write_text('{"metrics": {')
+    no_metrics = tmp_path / "no_metrics.json"
+    no_metrics.write_text('{}')
+    
+    assert _load_sample_metrics(str(good)).gc == 45.0
+    assert _load_sample_metrics(str(malformed)) is None
+    assert _load_sample_metrics(str(tmp_path / "missing.json")) is None
+    assert _load_sample_metrics(str(no_metrics)) == _SampleMetrics()
+
+
+def test_batch_outliers_match_baseline(tmp_path):
+    """Test flagged outliers and statistics for a fixture batch"""
+    processor = BatchProcessor([], str(tmp_path / "batch"), organism='human')
+    for sample_name, analysis in BATCH_ANALYSES.items():
+        analysis_json = tmp_path / f"{sample_name}.json"
+        if isinstance(analysis, str):
+            analysis_json.write_text(analysis)
+        elif analysis is not None:
+            analysis_json.write_text(json.dumps(analysis))
+        processor.results.append(BatchSampleResult(
+            sample_name=sample_name,
+            fastq_path=f"{sample_name}.fastq.gz",
+            status="success",
+            overall_status="PASS",
+            analysis_json=str(analysis_json)
+        ))
+    
+    stats = processor._calculate_statistics()
+    
+    # Output of the original per-sample implementation on this batch
+    assert stats.outliers == [
+        {'sample': 's09', 'metric': 'GC content', 'value': '60.0%', 'reason': 'unusual GC distribution'},
+        {'sample': 's16', 'metric': 'GC content', 'value': '30.0%', 'reason': 'possible contamination'},
+        {'sample': 's10', 'metric': 'Quality', 'value': 'Q20.0', 'reason': 'resequence recommended'},
+    ]
+    
+    gc_values = [45.0, 46.0, 44.5, 45.5, 45.2, 44.8, 46.2, 45.1, 60.0, 45.0, 45.3, 30.0]
+    assert stats.gc_mean == pytest.approx(statistics.mean(gc_values))
+    assert stats.gc_std == pytest.approx(statistics.stdev(gc_values))
+    quality_values = [36.0, 35.5, 36.5, 35.8, 36.2, 35.9, 36.1, 35.7, 36.0, 20.0, 36.0, 36.0, 29.0]
+    assert stats.quality_mean == pytest.approx(statistics.mean(quality_values))
+    assert stats.quality_std == pytest.approx(statistics.stdev(quality_values))
+    assert stats.pass_count == len(BATCH_ANALYSES)
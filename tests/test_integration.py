@@ -90,6 +90,10 @@ class TestPhredatorIntegration:
         assert len(analysis.metrics) > 0
         assert len(analysis.all_recommendations) > 0
         
+        # Hand-written to_dict must stay in sync with the dataclass fields
+        from dataclasses import asdict
+        assert analysis.to_dict() == asdict(analysis)
+        
         print(f"✓ Analysis complete: {analysis.overall_status.upper()}")
         print(f"✓ Profile: {analysis.profile_info}")
         print(f"✓ Metrics analyzed: {len(analysis.metrics)}")
@@ -350,6 +354,96 @@ class TestPhredatorIntegration:
         print(f"  - Parsed: {parsed_file}")
         print(f"  - Analysis: {analysis_file}")
         print(f"  - Fixes: {fixes_file}")
+    
+    def test_11_run_many(self, sample_fastqc_data, tmp_path):
+        """Test analyzing several samples through a process pool."""
+        report = FastQCParser(str(sample_fastqc_data)).parse()
+        
+        parsed_files = []
+        for i in range(3):
+            parsed_file = tmp_path / f"parsed_{i}.json"
+            parsed_file.write_text(report.to_json())
+            parsed_files.append(str(parsed_file))
+        
+        expected = Analyzer(parsed_files[0], organism='human').run()
+        results = list(Analyzer.run_many(parsed_files, n_jobs=2, organism='human'))
+        
+        assert len(results) == 3
+        assert all(r.to_dict() == expected.to_dict() for r in results)
+        
+        print(f"✓ Analyzed {len(results)} samples in parallel")
+    
+    @pytest.mark.parametrize("parallel", [0, 1])
+    def test_12_batch_serial_parallel_values(self, sample_fastqc_data, tmp_path, parallel):
+        """Test that --parallel 0 and 1 both process the batch serially."""
+        processor = BatchProcessor(
+            [str(sample_fastqc_data)],
+            str(tmp_path / "batch"),
+            organism='human',
+            check_tools=False,
+            parallel=parallel
+        )
+        assert processor.chunk_size == 1
+        
+        report = processor.process_all()
+        assert report.successful == 1
+        assert report.failed == 0
+        
+        print(f"✓ Batch with parallel={parallel} ran serially")
+    
+    def test_13_parse_zip_matches_directory(self, sample_fastqc_data, tmp_path):
+        """Test parsing the same FastQC data from a directory, a zip and CRLF text."""
+        import zipfile
+        
+        zip_path = tmp_path / "zipped" / "sample_fastqc.zip"
+        zip_path.parent.mkdir()
+        with zipfile.ZipFile(zip_path, 'w') as z:
+            # FastQC nests the data file in a <sample>_fastqc/ folder
+            z.write(sample_fastqc_data / "fastqc_data.txt", "sample_fastqc/fastqc_data.txt")
+        
+        crlf_dir = tmp_path / "crlf" / "sample_fastqc"
+        crlf_dir.mkdir(parents=True)
+        text = (sample_fastqc_data / "fastqc_data.txt").read_text()
+        (crlf_dir / "fastqc_data.txt").write_bytes(text.replace('\n', '\r\n').encode('utf-8'))
+        
+        from_dir = FastQCParser(str(sample_fastqc_data)).parse().to_dict()
+        from_zip = FastQCParser(str(zip_path)).parse().to_dict()
+        from_crlf = FastQCParser(str(crlf_dir)).parse().to_dict()
+        
+        assert from_dir['per_base_quality']
+        assert from_dir['gc_content_distribution']
+        assert from_dir['duplication_levels']
+        assert from_zip == from_dir
+        assert from_crlf == from_dir
+        
+        print("✓ Directory, zip and CRLF inputs parse identically")
+    
+    def test_14_batch_parallel_streamed_samples(self, sample_fastqc_data, tmp_path):
+        """Test a parallel batch over a streamed sample list keeps input order."""
+        import shutil
+        
+        sample_dirs = []
+        for name in ("a_fastqc", "b_fastqc", "c_fastqc"):
+            sample_dir = tmp_path / name
+            shutil.copytree(sample_fastqc_data, sample_dir)
+            sample_dirs.append(str(sample_dir))
+        sample_dirs.append(str(tmp_path / "missing_fastqc"))
+        
+        processor = BatchProcessor(
+            (path for path in sample_dirs),
+            str(tmp_path / "batch"),
+            organism='human',
+            check_tools=False,
+            parallel=2,
+            chunk_size=1
+        )
+        report = processor.process_all()
+        
+        assert [r.sample_name for r in report.sample_results] == ["a_fastqc", "b_fastqc", "c_fastqc", "missing_fastqc"]
+        assert [r.status for r in report.sample_results] == ["success", "success", "success", "skipped"]
+        assert report.total_samples == 4
+        
+        print("✓ Parallel batch over a streamed list completed in order")
 
 
 def test_summary():
@@ -0,0 +1,77 @@
+"""
+Tests for fix selection in the Fixer
+"""
+
+import itertools
+
+from phredator.fixer.qc_fixer import Fixer, FixSuggestion
+
+
+def _fix(category, priority, name):
+    return FixSuggestion(
+        category=category,
+        priority=priority,
+        description=name,
+        command=f"run {name}",
+        reason="test"
+    )
+
+
+def _reference_pipeline(fixer, all_fixes):
+    """The original selection: stable sort by (priority, category), first fix per category wins"""
+    priority_order = {"high": 0, "medium": 1, "low": 2}
+    category_order = {
+        "quality_trimming": 0,
+        "adapter_removal": 1,
+        "contamination_screening": 2,
+        "contamination_removal": 3,
+        "duplicate_removal": 4
+    }
+    sorted_fixes = sorted(
+        all_fixes,
+        key=lambda x: (priority_order.get(x.priority, 3), category_order.get(x.category, 5))
+    )
+    
+    seen_categories = set()
+    pipeline = []
+    for fix in sorted_fixes:
+        if fix.category not in seen_categories:
+            pipeline.extend((f"# {fix.description}", fix.command, ""))
+            seen_categories.add(fix.category)
+    
+    pipeline.append("# Re-run FastQC to verify improvements")
+    pipeline.append(f"fastqc {fixer.sample_name}_trimmed.fastq.gz -o fastqc_output/")
+    return pipeline
+
+
+def test_select_fixes_with_tied_priorities():
+    """Test one fix per category is picked in the original sort order"""
+    fixer = Fixer("analysis.json")
+    
+    all_fixes = [
+        _fix("duplicate_removal", "medium", "picard"),
+        _fix("adapter_removal", "medium", "cutadapt"),
+        _fix("adapter_removal", "medium", "fastp adapters"),
+        _fix("quality_trimming", "high", "fastp trim"),
+        _fix("quality_trimming", "high", "trimmomatic trim"),
+        _fix("custom_step", "medium", "custom"),
+        _fix("duplicate_removal", "high", "samtools"),
+        _fix("contamination_screening", "unknown", "screen"),
+        _fix("adapter_removal", "low", "trimmomatic adapters"),
+    ]
+    
+    pipeline = fixer._sort_and_select_fixes(all_fixes)
+    
+    # Ties keep input order: the first listed fix of each category wins
+    assert [line for line in pipeline if line.startswith("# ")][:-1] == [
+        "# fastp trim",
+        "# samtools",
+        "# cutadapt",
+        "# custom",
+        "# screen",
+    ]
+    assert pipeline == _reference_pipeline(fixer, all_fixes)
+    
+    # Any input order selects the same way the original sort did
+    for order in itertools.permutations(all_fixes[:6]):
+        assert fixer._sort_and_select_fixes(list(order)) == _reference_pipeline(fixer, list(order))